@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Add project_name_lower column to wiki_projects table
+
+Revision ID: i9j0k1l2m3n4
+Revises: h8i9j0k1l2m3
+Create Date: 2025-12-15 10:00:00.000000+08:00
+
+This migration adds an indexed, lowercased copy of project_name so that
+repository access checks can match cached repo names without case folding
+every project name on each request.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "i9j0k1l2m3n4"
+down_revision: Union[str, None] = "h8i9j0k1l2m3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add project_name_lower column to wiki_projects table."""
+    op.add_column(
+        "wiki_projects",
+        sa.Column(
+            "project_name_lower",
+            sa.String(200),
+            nullable=False,
+            server_default="",
+            comment="Lowercased project name for case-insensitive matching",
+        ),
+    )
+
+    # Backfill existing records
+    op.execute("""
+        UPDATE wiki_projects SET project_name_lower = LOWER(project_name)
+        """)
+
+    op.create_index("idx_project_name_lower", "wiki_projects", ["project_name_lower"])
+
+
+def downgrade() -> None:
+    """Remove project_name_lower column from wiki_projects table."""
+    op.drop_index("idx_project_name_lower", table_name="wiki_projects")
+    op.drop_column("wiki_projects", "project_name_lower")
@@ -14,6 +14,7 @@ from app.core.wiki_config import wiki_settings
 from app.db.session import get_wiki_db
 from app.models.user import User
 from app.schemas.wiki import (
+    WikiContentHeader,
     WikiContentInDB,
     WikiContentWriteRequest,
     WikiGenerationCreate,
@@ -144,6 +145,10 @@ def get_wiki_generations(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
     project_id: int = Query(None, description="Filter by project ID"),
+    include_total: Optional[bool] = Query(
+        None,
+        description="Whether to compute the total count (defaults to first page only)",
+    ),
     current_user: User = Depends(security.get_current_user),
     wiki_db: Session = Depends(get_wiki_db),
 ):
@@ -152,17 +157,27 @@ def get_wiki_generations(
     Always uses system-bound user ID (WIKI_DEFAULT_USER_ID) for querying generations.
     - When WIKI_DEFAULT_USER_ID > 0: returns system-bound user's generations
     - When WIKI_DEFAULT_USER_ID = 0: returns all users' generations (legacy behavior)
+
+    The total count is only computed on the first page unless include_total is set;
+    use has_next to drive pagination on subsequent pages.
     """
     skip = (page - 1) * limit
+    if include_total is None:
+        include_total = page == 1
 
     # Always use system-bound user ID for querying generations
     # When WIKI_DEFAULT_USER_ID = 0, pass user_id=0 to query all users' generations (legacy behavior)
     user_id = wiki_settings.DEFAULT_USER_ID  # 0 means query all users (legacy)
 
-    items, total = wiki_service.get_generations(
-        db=wiki_db, user_id=user_id, project_id=project_id, skip=skip, limit=limit
+    items, total, has_next = wiki_service.get_generations(
+        db=wiki_db,
+        user_id=user_id,
+        project_id=project_id,
+        skip=skip,
+        limit=limit,
+        include_total=include_total,
     )
-    return {"total": total, "items": items}
+    return {"total": total, "has_next": has_next, "items": items}
 
 
 @router.get("/generations/{generation_id}", response_model=WikiGenerationDetail)
@@ -181,8 +196,9 @@ def get_wiki_generation(
     # When WIKI_DEFAULT_USER_ID = 0, pass user_id=0 to query all users' generation details (legacy behavior)
     user_id = wiki_settings.DEFAULT_USER_ID  # 0 means query all users (legacy)
 
+    # Contents are eager-loaded with the generation instead of re-verifying it
     generation = wiki_service.get_generation_detail(
-        db=wiki_db, generation_id=generation_id, user_id=user_id
+        db=wiki_db, generation_id=generation_id, user_id=user_id, with_contents=True
     )
 
     # Get project info
@@ -190,15 +206,10 @@ def get_wiki_generation(
         db=wiki_db, project_id=generation.project_id
     )
 
-    # Get contents
-    contents = wiki_service.get_generation_contents(
-        db=wiki_db, generation_id=generation_id, user_id=user_id
-    )
-
     # Build response
     generation_dict = generation.__dict__.copy()
     generation_dict["project"] = project
-    generation_dict["contents"] = contents
+    generation_dict["contents"] = generation.contents
 
     return generation_dict
 
@@ -240,11 +251,32 @@ def get_wiki_generation_contents(
     )
 
 
+@router.get(
+    "/generations/{generation_id}/contents/headers",
+    response_model=list[WikiContentHeader],
+)
+def get_wiki_generation_content_headers(
+    generation_id: int,
+    current_user: User = Depends(security.get_current_user),
+    wiki_db: Session = Depends(get_wiki_db),
+):
+    """Get wiki generation content headers (section list without bodies).
+
+    Uses system-bound user ID (WIKI_DEFAULT_USER_ID) like the contents endpoint.
+    """
+    user_id = wiki_settings.DEFAULT_USER_ID  # 0 means query all users (legacy)
+
+    return wiki_service.get_generation_content_headers(
+        db=wiki_db, generation_id=generation_id, user_id=user_id
+    )
+
+
 @router.post("/generations/{generation_id}/cancel", response_model=WikiGenerationInDB)
 def cancel_wiki_generation(
     generation_id: int,
     current_user: User = Depends(security.get_current_user),
     wiki_db: Session = Depends(get_wiki_db),
+    main_db: Session = Depends(get_db),
 ):
     """Cancel a wiki generation task.
 
@@ -261,7 +293,7 @@ def cancel_wiki_generation(
     )
 
     return wiki_service.cancel_wiki_generation(
-        wiki_db=wiki_db, generation_id=generation_id, user_id=user_id
+        wiki_db=wiki_db, generation_id=generation_id, user_id=user_id, main_db=main_db
     )
 
 
@@ -308,7 +340,7 @@ def get_wiki_project(project_id: int, db: Session = Depends(get_wiki_db)):
 
     # Get recent generations for this project using system-bound user ID
     # When WIKI_DEFAULT_USER_ID = 0, returns all users' generations (legacy behavior)
-    generations, _ = wiki_service.get_generations(
+    generations, _, _ = wiki_service.get_generations(
         db=db,
         user_id=wiki_settings.DEFAULT_USER_ID,  # Use system-bound user ID
         project_id=project_id,
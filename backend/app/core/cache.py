@@ -4,7 +4,7 @@
 
 import asyncio
 import logging
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
 import orjson
 from redis import Redis as SyncRedis
@@ -86,6 +86,36 @@ class RedisCache:
             logger.error(f"Error getting cache key {key} (sync): {str(e)}")
             return None
 
+    def get_many_sync(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get multiple values from cache synchronously with a single MGET"""
+        if not keys:
+            return []
+        try:
+            client = SyncRedis.from_url(
+                self._url,
+                encoding="utf-8",
+                decode_responses=False,
+                socket_timeout=5.0,
+                socket_connect_timeout=2.0,
+            )
+            try:
+                values = []
+                for data in client.mget(keys):
+                    if data is None:
+                        values.append(None)
+                        continue
+                    try:
+                        values.append(orjson.loads(data))
+                    except Exception:
+                        # If value was stored as plain bytes/string
+                        values.append(data)
+                return values
+            finally:
+                client.close()
+        except Exception as e:
+            logger.error(f"Error getting cache keys {keys} (sync): {str(e)}")
+            return [None] * len(keys)
+
     def get_user_repositories_sync(
         self, user_id: int, git_domain: str
     ) -> Optional[list]:
@@ -102,6 +132,25 @@ class RedisCache:
         cache_key = self.generate_full_cache_key(user_id, git_domain)
         return self.get_sync(cache_key)
 
+    def get_user_repositories_batch_sync(
+        self, user_id: int, git_domains: List[str]
+    ) -> Dict[str, Optional[list]]:
+        """
+        Get user's cached repository lists for several domains in one round trip.
+
+        Args:
+            user_id: User ID
+            git_domains: Git domains to look up
+
+        Returns:
+            Dict mapping each domain to its cached repositories, or None if not cached
+        """
+        cache_keys = [
+            self.generate_full_cache_key(user_id, git_domain)
+            for git_domain in git_domains
+        ]
+        return dict(zip(git_domains, self.get_many_sync(cache_keys)))
+
     async def set(
         self, key: str, value: Any, expire: int = settings.REPO_CACHE_EXPIRED_TIME
     ) -> bool:
@@ -29,6 +29,11 @@ class WikiSettings(BaseSettings):
     RESULT_POLL_INTERVAL_SECONDS: int = 30  # Background polling interval
     RESULT_POLL_BATCH_SIZE: int = 20  # Background polling batch size
 
+    # Wiki project access check configuration (env var: WIKI_ACCESS_CHECK_MAX_WORKERS)
+    ACCESS_CHECK_MAX_WORKERS: int = (
+        16  # Maximum parallel API calls when repository cache is unavailable
+    )
+
     # Wiki content configuration (env var: WIKI_MAX_CONTENT_SIZE)
     MAX_CONTENT_SIZE: int = 10 * 1024 * 1024  # Maximum content size 10MB
     SUPPORTED_FORMATS: list[str] = ["markdown", "html"]  # Supported formats
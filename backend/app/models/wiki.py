@@ -17,7 +17,9 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    event,
 )
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.db.session import WikiBase
@@ -30,6 +32,9 @@ class WikiProject(WikiBase):
 
     id = Column(Integer, primary_key=True, index=True)
     project_name = Column(String(200), nullable=False, index=True)
+    # Lowercased copy of project_name, kept in sync by mapper events below so
+    # access checks can compare against cached repo names without case folding
+    project_name_lower = Column(String(200), nullable=False, default="", index=True)
     project_type = Column(String(50), nullable=False, default="git", index=True)
     source_type = Column(String(50), nullable=False, default="github", index=True)
     source_url = Column(String(500), nullable=False, unique=True)
@@ -44,6 +49,13 @@ class WikiProject(WikiBase):
     __table_args__ = ({"mysql_engine": "InnoDB", "mysql_charset": "utf8mb4"},)
 
 
+@event.listens_for(WikiProject, "before_insert")
+@event.listens_for(WikiProject, "before_update")
+def _sync_project_name_lower(mapper, connection, target: WikiProject) -> None:
+    """Keep project_name_lower in sync with project_name on write"""
+    target.project_name_lower = (target.project_name or "").lower()
+
+
 class WikiGenerationStatus(str, PyEnum):
     """Wiki generation status enum"""
 
@@ -94,6 +106,15 @@ class WikiGeneration(WikiBase):
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
     completed_at = Column(DateTime, nullable=False, default="1970-01-01 00:00:00")
 
+    # Contents must be loaded explicitly (e.g. selectinload) to avoid hidden N+1
+    # queries; lazy="raise" makes accidental lazy access fail fast
+    contents = relationship(
+        "WikiContent",
+        order_by="WikiContent.created_at",
+        lazy="raise",
+        viewonly=True,  # Contents are written through WikiContent directly
+    )
+
     __table_args__ = (
         Index("idx_user_project", "user_id", "project_id"),
         {"mysql_engine": "InnoDB", "mysql_charset": "utf8mb4"},
@@ -162,6 +162,21 @@ class WikiContentInDB(BaseModel):
         from_attributes = True
 
 
+class WikiContentHeader(BaseModel):
+    """Wiki content header without the content body"""
+
+    id: int
+    generation_id: int
+    type: str
+    title: str
+    parent_id: Optional[int]
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 # ========== Response Schemas ==========
 class WikiGenerationDetail(WikiGenerationInDB):
     """Wiki generation detail (includes project info and contents)"""
@@ -173,7 +188,8 @@ class WikiGenerationDetail(WikiGenerationInDB):
 class WikiGenerationListResponse(BaseModel):
     """Wiki generation list response"""
 
-    total: int
+    total: Optional[int] = None
+    has_next: bool = False
     items: List[WikiGenerationInDB]
 
 
@@ -3,16 +3,19 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, exists, or_
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.sql import func
 
 from app.core.cache import cache_manager
 from app.core.wiki_config import wiki_settings
 from app.core.wiki_prompts import get_wiki_task_prompt
+from app.db.session import SessionLocal
 from app.models.user import User
 from app.models.wiki import (
     WikiContent,
@@ -21,6 +24,9 @@ from app.models.wiki import (
     WikiGenerationType,
     WikiProject,
 )
+from app.repository.gitea_provider import GiteaProvider
+from app.repository.github_provider import GitHubProvider
+from app.repository.gitlab_provider import GitLabProvider
 from app.schemas.task import TaskCreate
 from app.schemas.wiki import (
     WikiContentWriteRequest,
@@ -35,6 +41,23 @@ logger = logging.getLogger(__name__)
 
 INTERNAL_CONTENT_WRITE_TOKEN = wiki_settings.INTERNAL_API_TOKEN
 
+# Shared provider instances for repository access checks (providers are stateless)
+_REPO_PROVIDERS = {
+    "gitlab": GitLabProvider(),
+    "github": GitHubProvider(),
+    "gitea": GiteaProvider(),
+}
+
+# (user_tokens, repo_ids_by_key, repo_names_by_key, uncached_domain_keys,
+#  fallback_key_by_type), keys being (source_type, domain)
+_RepoAccessLookup = Tuple[
+    Dict[str, Dict[str, str]],
+    Dict[Tuple[str, str], set],
+    Dict[Tuple[str, str], set],
+    FrozenSet[Tuple[str, str]],
+    Dict[str, Tuple[str, str]],
+]
+
 
 class WikiService:
     """Wiki document service"""
@@ -450,28 +473,14 @@ class WikiService:
             }
 
         try:
+            provider = _REPO_PROVIDERS.get(source_type)
             if source_type == "gitlab":
-                from app.repository.gitlab_provider import GitLabProvider
-
-                provider = GitLabProvider()
                 result = provider.check_user_project_access(
                     token=git_token,
                     git_domain=source_domain or "",
                     project_id=project_identifier,
                 )
-            elif source_type == "github":
-                from app.repository.github_provider import GitHubProvider
-
-                provider = GitHubProvider()
-                result = provider.check_user_project_access(
-                    token=git_token,
-                    git_domain=source_domain or "",
-                    repo_name=project_name,
-                )
-            elif source_type == "gitea":
-                from app.repository.gitea_provider import GiteaProvider
-
-                provider = GiteaProvider()
+            elif source_type in ("github", "gitea"):
                 result = provider.check_user_project_access(
                     token=git_token,
                     git_domain=source_domain or "",
@@ -758,7 +767,8 @@ class WikiService:
         project_id: Optional[int] = None,
         skip: int = 0,
         limit: int = 10,
-    ) -> Tuple[List[WikiGeneration], int]:
+        include_total: bool = False,
+    ) -> Tuple[List[WikiGeneration], Optional[int], bool]:
         """
         Get generation records list (paginated)
 
@@ -767,6 +777,10 @@ class WikiService:
             project_id: Optional project ID to filter by
             skip: Number of records to skip
             limit: Maximum number of records to return
+            include_total: Whether to run the extra COUNT query for the total
+
+        Returns:
+            Tuple of (generations, total or None if not requested, has_next)
         """
         query = db.query(WikiGeneration)
 
@@ -777,27 +791,38 @@ class WikiService:
         if project_id:
             query = query.filter(WikiGeneration.project_id == project_id)
 
-        total = query.count()
+        total = query.count() if include_total else None
+
+        # Fetch one extra row to know whether a next page exists without counting
         generations = (
             query.order_by(WikiGeneration.created_at.desc())
             .offset(skip)
-            .limit(limit)
+            .limit(limit + 1)
             .all()
         )
+        has_next = len(generations) > limit
 
-        return generations, total
+        return generations[:limit], total, has_next
 
     def get_generation_detail(
-        self, db: Session, generation_id: int, user_id: int
+        self,
+        db: Session,
+        generation_id: int,
+        user_id: int,
+        with_contents: bool = False,
     ) -> WikiGeneration:
         """
         Get generation record detail
 
         Args:
             user_id: User ID to filter by. If 0, returns generation for all users
+            with_contents: Eager-load generation contents in one extra IN query
         """
         query = db.query(WikiGeneration).filter(WikiGeneration.id == generation_id)
 
+        if with_contents:
+            query = query.options(selectinload(WikiGeneration.contents))
+
         # Only filter by user_id when it's not 0 (0 means query all users)
         if user_id != 0:
             query = query.filter(WikiGeneration.user_id == user_id)
@@ -809,6 +834,29 @@ class WikiService:
 
         return generation
 
+    def _filter_contents_by_generation(self, query, generation_id: int, user_id: int):
+        """Join contents with their generation and apply ownership filtering"""
+        query = query.join(
+            WikiGeneration, WikiGeneration.id == WikiContent.generation_id
+        ).filter(WikiGeneration.id == generation_id)
+
+        # Only filter by user_id when it's not 0 (0 means query all users)
+        if user_id != 0:
+            query = query.filter(WikiGeneration.user_id == user_id)
+
+        return query.order_by(WikiContent.created_at)
+
+    def _ensure_generation_exists(
+        self, db: Session, generation_id: int, user_id: int
+    ) -> None:
+        """Raise 404 if the generation does not exist (or belong to user)"""
+        conditions = [WikiGeneration.id == generation_id]
+        if user_id != 0:
+            conditions.append(WikiGeneration.user_id == user_id)
+
+        if not db.query(exists().where(*conditions)).scalar():
+            raise HTTPException(status_code=404, detail="Generation not found")
+
     def get_generation_contents(
         self, db: Session, generation_id: int, user_id: int
     ) -> List[WikiContent]:
@@ -818,18 +866,48 @@ class WikiService:
         Args:
             user_id: User ID to filter by. If 0, returns contents for all users
         """
-        # First verify the generation exists (and belongs to user if user_id != 0)
-        generation = self.get_generation_detail(db, generation_id, user_id)
+        # Verify ownership and load contents in a single joined query
+        contents = self._filter_contents_by_generation(
+            db.query(WikiContent), generation_id, user_id
+        ).all()
 
-        contents = (
-            db.query(WikiContent)
-            .filter(WikiContent.generation_id == generation_id)
-            .order_by(WikiContent.created_at)
-            .all()
-        )
+        # Only hit the database again to tell a missing generation from an empty one
+        if not contents:
+            self._ensure_generation_exists(db, generation_id, user_id)
 
         return contents
 
+    def get_generation_content_headers(
+        self, db: Session, generation_id: int, user_id: int
+    ) -> List[Any]:
+        """
+        Get content headers (no body) of a wiki generation
+
+        Only selects lightweight columns so large content bodies are not
+        transferred when callers just need the section list.
+
+        Args:
+            user_id: User ID to filter by. If 0, returns headers for all users
+        """
+        headers = self._filter_contents_by_generation(
+            db.query(
+                WikiContent.id,
+                WikiContent.generation_id,
+                WikiContent.type,
+                WikiContent.title,
+                WikiContent.parent_id,
+                WikiContent.created_at,
+                WikiContent.updated_at,
+            ),
+            generation_id,
+            user_id,
+        ).all()
+
+        if not headers:
+            self._ensure_generation_exists(db, generation_id, user_id)
+
+        return headers
+
     def get_projects(
         self,
         db: Session,
@@ -842,6 +920,11 @@ class WikiService:
         """
         Get project list (paginated) with user access filtering.
 
+        Access filtering is pushed into SQL using the user's cached repository
+        lists, so only accessible rows are loaded. Projects that can only be
+        verified via the git provider API are fetched as candidates and checked
+        in Python, in which case pagination is applied after filtering.
+
         Args:
             db: Database session
             user: Current user for access filtering. If None, returns all projects (admin mode)
@@ -861,47 +944,77 @@ class WikiService:
         if source_type:
             query = query.filter(WikiProject.source_type == source_type)
 
-        # Get all projects first, then filter by user access
-        all_projects = query.order_by(WikiProject.created_at.desc()).all()
-
         # If no user provided (admin mode), return all projects
         if user is None:
-            total = len(all_projects)
-            paginated_projects = all_projects[skip : skip + limit]
+            total = query.count()
+            paginated_projects = (
+                query.order_by(WikiProject.created_at.desc())
+                .offset(skip)
+                .limit(limit)
+                .all()
+            )
+            return paginated_projects, total
+
+        if not user.git_info:
+            logger.warning(
+                f"User {user.id} has no git_info configured, returning empty project list"
+            )
+            return [], 0
+
+        access_lookup = self._build_repo_access_lookup(user)
+        cached_condition, api_check_condition = self._build_project_access_conditions(
+            access_lookup
+        )
+
+        if api_check_condition is None:
+            # Every candidate can be decided from cache, paginate in SQL
+            if cached_condition is None:
+                return [], 0
+            query = query.filter(cached_condition)
+            total = query.count()
+            if skip >= total:
+                return [], total
+            paginated_projects = (
+                query.order_by(WikiProject.created_at.desc())
+                .offset(skip)
+                .limit(limit)
+                .all()
+            )
             return paginated_projects, total
 
-        # Filter projects by user's repository access
-        accessible_projects = self._filter_projects_by_user_access(all_projects, user)
+        # Load cache matches plus API-check candidates, then filter in Python
+        if cached_condition is not None:
+            query = query.filter(or_(cached_condition, api_check_condition))
+        else:
+            query = query.filter(api_check_condition)
+        candidate_projects = query.order_by(WikiProject.created_at.desc()).all()
+
+        accessible_projects = self._filter_projects_by_user_access(
+            candidate_projects, user, access_lookup=access_lookup
+        )
 
         total = len(accessible_projects)
         paginated_projects = accessible_projects[skip : skip + limit]
 
         return paginated_projects, total
 
-    def _filter_projects_by_user_access(
-        self, projects: List[WikiProject], user: User
-    ) -> List[WikiProject]:
+    def _build_repo_access_lookup(self, user: User) -> _RepoAccessLookup:
         """
-        Filter projects based on user's repository access permissions.
-
-        Uses cached repository list from Redis for fast batch permission checking.
-        First builds a lookup set from all cached repos, then batch matches all projects.
-        Falls back to API calls only for projects where cache is not available.
+        Build repository access lookup structures from the user's cached repos.
 
         Args:
-            projects: List of WikiProject objects to filter
             user: User object with git_info containing tokens
 
         Returns:
-            List of projects the user has read access to
+            Tuple of:
+            - user_tokens: source_type -> {domain -> token}
+            - repo_ids_by_key: (source_type, domain) -> cached repo IDs
+            - repo_names_by_key: (source_type, domain) -> cached lowercased repo
+              full names
+            - uncached_domain_keys: (source_type, domain) pairs without a cache
+            - fallback_key_by_type: source_type -> first cached (source_type,
+              domain), used for project domains the user has no token for
         """
-        if not user.git_info:
-            # User has no git info configured, return empty list
-            logger.warning(
-                f"User {user.id} has no git_info configured, returning empty project list"
-            )
-            return []
-
         # Build a map of user's git tokens by source_type and domain
         user_tokens: Dict[str, Dict[str, str]] = {}
 
@@ -909,9 +1022,9 @@ class WikiService:
         # Key: (source_type, domain) -> set of (repo_id, full_name_lower)
         cached_repo_ids: Dict[Tuple[str, str], set] = {}
         cached_repo_names: Dict[Tuple[str, str], set] = {}
-        has_cache_for_domain: Dict[Tuple[str, str], bool] = {}
+        uncached_keys = set()
 
-        for git_info in user.git_info:
+        for git_info in user.git_info or []:
             git_type = git_info.get("type", "")
             git_domain = git_info.get("git_domain", "")
             git_token = git_info.get("git_token", "")
@@ -920,14 +1033,24 @@ class WikiService:
                     user_tokens[git_type] = {}
                 user_tokens[git_type][git_domain] = git_token
 
-                # Try to get cached repositories for this domain
+        # Fetch cached repositories for all configured domains in one round trip
+        domains = list(
+            {
+                domain
+                for domain_tokens in user_tokens.values()
+                for domain in domain_tokens
+            }
+        )
+        cached_repos_by_domain = cache_manager.get_user_repositories_batch_sync(
+            user.id, domains
+        )
+
+        for git_type, domain_tokens in user_tokens.items():
+            for git_domain in domain_tokens:
                 cache_key = (git_type, git_domain)
-                cached_repos = cache_manager.get_user_repositories_sync(
-                    user.id, git_domain
-                )
+                cached_repos = cached_repos_by_domain.get(git_domain)
 
                 if cached_repos:
-                    has_cache_for_domain[cache_key] = True
                     # Build lookup sets for batch matching
                     repo_ids = set()
                     repo_names = set()
@@ -947,7 +1070,155 @@ class WikiService:
                         f"{len(repo_ids)} repo IDs, {len(repo_names)} repo names"
                     )
                 else:
-                    has_cache_for_domain[cache_key] = False
+                    uncached_keys.add(cache_key)
+
+        # Projects on domains the user has no token for fall back to the first
+        # cached domain of their source type
+        fallback_key_by_type: Dict[str, Tuple[str, str]] = {}
+        for cache_key in cached_repo_ids:
+            fallback_key_by_type.setdefault(cache_key[0], cache_key)
+
+        return (
+            user_tokens,
+            cached_repo_ids,
+            cached_repo_names,
+            frozenset(uncached_keys),
+            fallback_key_by_type,
+        )
+
+    def _build_project_access_conditions(
+        self,
+        access_lookup: _RepoAccessLookup,
+    ) -> Tuple[Optional[Any], Optional[Any]]:
+        """
+        Translate the access lookup into SQL conditions on WikiProject.
+
+        Args:
+            access_lookup: Result of _build_repo_access_lookup
+
+        Returns:
+            Tuple of (condition matching projects found in cached repos,
+            condition matching projects that need an API check), each None
+            when no project can match it
+        """
+        (
+            user_tokens,
+            repo_ids_by_key,
+            repo_names_by_key,
+            uncached_domain_keys,
+            fallback_key_by_type,
+        ) = access_lookup
+        source_domain = func.coalesce(WikiProject.source_domain, "")
+
+        cached_conditions = []
+        api_check_conditions = []
+        for source_type, domain_tokens in user_tokens.items():
+            configured_domains = list(domain_tokens)
+            type_condition = WikiProject.source_type == source_type
+
+            uncached_domains = [
+                domain
+                for domain in configured_domains
+                if (source_type, domain) in uncached_domain_keys
+            ]
+            if uncached_domains:
+                api_check_conditions.append(
+                    and_(type_condition, source_domain.in_(uncached_domains))
+                )
+
+            # Cached domains only match projects on that same domain
+            for domain in configured_domains:
+                cache_key = (source_type, domain)
+                if cache_key not in repo_ids_by_key:
+                    continue
+                repo_match = self._build_repo_match_condition(
+                    repo_ids_by_key[cache_key], repo_names_by_key[cache_key]
+                )
+                if repo_match is not None:
+                    cached_conditions.append(
+                        and_(type_condition, source_domain == domain, repo_match)
+                    )
+
+            # Domains the user has no token for use the type's fallback cache
+            other_domains = and_(
+                type_condition, source_domain.notin_(configured_domains)
+            )
+            fallback_key = fallback_key_by_type.get(source_type)
+            if fallback_key is None:
+                api_check_conditions.append(other_domains)
+                continue
+            repo_match = self._build_repo_match_condition(
+                repo_ids_by_key[fallback_key], repo_names_by_key[fallback_key]
+            )
+            if repo_match is not None:
+                cached_conditions.append(and_(other_domains, repo_match))
+
+        cached_condition = or_(*cached_conditions) if cached_conditions else None
+        api_check_condition = (
+            or_(*api_check_conditions) if api_check_conditions else None
+        )
+        return cached_condition, api_check_condition
+
+    @staticmethod
+    def _build_repo_match_condition(repo_ids: set, repo_names: set) -> Optional[Any]:
+        """
+        Build the SQL condition matching projects by cached repo ID or name.
+
+        Args:
+            repo_ids: Cached repo IDs of one domain
+            repo_names: Cached lowercased repo full names of the same domain
+
+        Returns:
+            Condition on WikiProject, or None when both sets are empty
+        """
+        repo_matches = []
+        if repo_ids:
+            repo_matches.append(WikiProject.source_id.in_(repo_ids))
+        if repo_names:
+            repo_matches.append(WikiProject.project_name_lower.in_(repo_names))
+        return or_(*repo_matches) if repo_matches else None
+
+    def _filter_projects_by_user_access(
+        self,
+        projects: List[WikiProject],
+        user: User,
+        access_lookup: Optional[_RepoAccessLookup] = None,
+    ) -> List[WikiProject]:
+        """
+        Filter projects based on user's repository access permissions.
+
+        Uses cached repository list from Redis for fast batch permission checking.
+        First builds a lookup set from all cached repos, then batch matches all projects.
+        Falls back to API calls only for projects where cache is not available.
+
+        Args:
+            projects: List of WikiProject objects to filter
+            user: User object with git_info containing tokens
+            access_lookup: Prebuilt result of _build_repo_access_lookup, if any
+
+        Returns:
+            List of projects the user has read access to
+        """
+        if not projects:
+            # Nothing to check, avoid building token maps and reading Redis
+            return []
+
+        if not user.git_info:
+            # User has no git info configured, return empty list
+            logger.warning(
+                f"User {user.id} has no git_info configured, returning empty project list"
+            )
+            return []
+
+        if access_lookup is None:
+            access_lookup = self._build_repo_access_lookup(user)
+        (
+            user_tokens,
+            repo_ids_by_key,
+            repo_names_by_key,
+            uncached_domain_keys,
+            fallback_key_by_type,
+        ) = access_lookup
 
         # Batch filter projects using lookup sets
         accessible_projects = []
@@ -958,6 +1229,7 @@ class WikiService:
             source_domain = project.source_domain or ""
             source_id = project.source_id
             project_name = project.project_name
+            project_name_lower = project.project_name_lower
 
             # Check if user has token for this source type
             if source_type not in user_tokens:
@@ -966,57 +1238,76 @@ class WikiService:
                 )
                 continue
 
-            # Find the best matching cache key
+            # Match against the project's own domain; only domains the user has
+            # no token for fall back to another cached domain of the same type
             cache_key = (source_type, source_domain)
-
-            # If no exact domain match, try to find any cache for this source type
-            if cache_key not in has_cache_for_domain:
-                # Look for any cached domain for this source type
-                for (
-                    cached_type,
-                    cached_domain,
-                ), has_cache in has_cache_for_domain.items():
-                    if cached_type == source_type and has_cache:
-                        cache_key = (cached_type, cached_domain)
-                        break
-
-            # Check if we have cache for this domain
-            if has_cache_for_domain.get(cache_key, False):
-                # Fast batch lookup using sets
-                repo_ids = cached_repo_ids.get(cache_key, set())
-                repo_names = cached_repo_names.get(cache_key, set())
-
-                # Match by source_id (numeric project ID)
-                if source_id and source_id in repo_ids:
-                    logger.debug(
-                        f"User has access to project {project.id} (matched by source_id from cache)"
-                    )
-                    accessible_projects.append(project)
+            if cache_key in uncached_domain_keys:
+                projects_needing_api_check.append(project)
+                continue
+            if cache_key not in repo_ids_by_key:
+                cache_key = fallback_key_by_type.get(source_type)
+                if cache_key is None:
+                    # No cache available for this source type, need API check
+                    projects_needing_api_check.append(project)
                     continue
 
-                # Match by project_name (full path like "namespace/project")
-                if project_name and project_name.lower() in repo_names:
-                    logger.debug(
-                        f"User has access to project {project.id} (matched by project_name from cache)"
-                    )
-                    accessible_projects.append(project)
-                    continue
+            # Match by source_id (numeric project ID)
+            if source_id and source_id in repo_ids_by_key[cache_key]:
+                logger.debug(
+                    f"User has access to project {project.id} (matched by source_id from cache)"
+                )
+                accessible_projects.append(project)
+                continue
 
-                # Project not found in cached repos, user doesn't have access
+            # Match by project_name (full path like "namespace/project")
+            if (
+                project_name_lower
+                and project_name_lower in repo_names_by_key[cache_key]
+            ):
                 logger.debug(
-                    f"Project {project.id} ({project_name}) not found in user's cached repos, denying access"
+                    f"User has access to project {project.id} (matched by project_name from cache)"
                 )
-            else:
-                # No cache available for this domain, need API check
-                projects_needing_api_check.append(project)
+                accessible_projects.append(project)
+                continue
+
+            # Project not found in cached repos, user doesn't have access
+            logger.debug(
+                f"Project {project.id} ({project_name}) not found in user's cached repos, denying access"
+            )
 
         # Fallback: Check projects without cache via API (batch if possible)
         if projects_needing_api_check:
             logger.info(
                 f"Checking {len(projects_needing_api_check)} projects via API (no cache available)"
             )
+            # Several rows may track the same upstream repository, so check each
+            # distinct repository once and reuse the result for its duplicates
+            projects_by_access_key: Dict[Tuple[str, str, str], WikiProject] = {}
             for project in projects_needing_api_check:
-                if self._check_user_project_access_via_api(project, user_tokens):
+                projects_by_access_key.setdefault(
+                    self._get_api_access_key(project), project
+                )
+
+            # Each check is a blocking HTTP round trip, so run them concurrently
+            max_workers = min(
+                wiki_settings.ACCESS_CHECK_MAX_WORKERS, len(projects_by_access_key)
+            )
+            with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+                access_cache: Dict[Tuple[str, str, str], bool] = dict(
+                    zip(
+                        projects_by_access_key,
+                        executor.map(
+                            lambda p: self._check_user_project_access_via_api(
+                                p, user_tokens
+                            ),
+                            projects_by_access_key.values(),
+                        ),
+                    )
+                )
+
+            # Keep the original project order in the result
+            for project in projects_needing_api_check:
+                if access_cache[self._get_api_access_key(project)]:
                     accessible_projects.append(project)
 
         logger.info(
@@ -1024,6 +1315,26 @@ class WikiService:
         )
         return accessible_projects
 
+    @staticmethod
+    def _get_api_access_key(project: WikiProject) -> Tuple[str, str, str]:
+        """
+        Build the key identifying the repository an API access check targets.
+
+        Mirrors the identifier _check_user_project_access_via_api sends upstream:
+        GitLab checks by source_id when available, other platforms by name.
+
+        Args:
+            project: WikiProject object
+
+        Returns:
+            Tuple of (source_type, source_domain, repository identifier)
+        """
+        if project.source_type == "gitlab" and project.source_id:
+            identifier = str(project.source_id)
+        else:
+            identifier = project.project_name
+        return (project.source_type, project.source_domain or "", identifier)
+
     def _check_user_project_access_via_api(
         self, project: WikiProject, user_tokens: Dict[str, Dict[str, str]]
     ) -> bool:
@@ -1064,21 +1375,15 @@ class WikiService:
 
         try:
             if source_type == "gitlab":
-                from app.repository.gitlab_provider import GitLabProvider
-
-                provider = GitLabProvider()
                 # Use source_id if available, otherwise use project_name
                 project_identifier = source_id if source_id else project_name
-                result = provider.check_user_project_access(
+                result = _REPO_PROVIDERS["gitlab"].check_user_project_access(
                     token=git_token,
                     git_domain=source_domain,
                     project_id=project_identifier,
                 )
             elif source_type == "github":
-                from app.repository.github_provider import GitHubProvider
-
-                provider = GitHubProvider()
-                result = provider.check_user_project_access(
+                result = _REPO_PROVIDERS["github"].check_user_project_access(
                     token=git_token,
                     git_domain=source_domain,
                     repo_name=project_name,
@@ -1122,101 +1427,159 @@ class WikiService:
         return project
 
     def cancel_wiki_generation(
-        self, wiki_db: Session, generation_id: int, user_id: int
+        self,
+        wiki_db: Session,
+        generation_id: int,
+        user_id: int,
+        main_db: Optional[Session] = None,
     ) -> WikiGeneration:
         """
         Cancel a wiki generation task
 
         Process:
-        1. Verify generation belongs to user
-        2. Check if generation can be cancelled (PENDING or RUNNING status)
-        3. Stop related task execution first
-        4. Update generation status to CANCELLED
-        """
-        # Import here to avoid circular imports
-        from app.api.dependencies import get_db
-        from app.services.adapters.task_kinds import task_kinds_service
-
-        # Get main database session for task operations
-        main_db = next(get_db())
+        1. Atomically mark the user's PENDING or RUNNING generation CANCELLED with
+           one conditional UPDATE and commit, so the row lock is released before
+           any executor call
+        2. If nothing was updated, look up the status to answer 404 or 400
+        3. Stop related task execution in a separate task session
+        4. If the task cannot be stopped, restore the RUNNING status
 
+        Args:
+            main_db: Session for task operations. A dedicated session is opened
+                (and closed) when not provided, since delete_task commits on it.
+        """
         try:
-            # 1. Get generation and verify ownership
-            generation = (
+            # 1. Ownership and status are both checked in the UPDATE's WHERE clause
+            updated = (
                 wiki_db.query(WikiGeneration)
                 .filter(
                     WikiGeneration.id == generation_id,
                     WikiGeneration.user_id == user_id,
+                    WikiGeneration.status.in_(
+                        [WikiGenerationStatus.PENDING, WikiGenerationStatus.RUNNING]
+                    ),
+                )
+                .update(
+                    {
+                        WikiGeneration.status: WikiGenerationStatus.CANCELLED,
+                        WikiGeneration.completed_at: func.now(),
+                    },
+                    synchronize_session=False,
                 )
-                .first()
             )
+            wiki_db.commit()
 
-            if not generation:
-                raise HTTPException(status_code=404, detail="Generation not found")
-
-            # 2. Check if generation can be cancelled
-            if generation.status not in [
-                WikiGenerationStatus.PENDING,
-                WikiGenerationStatus.RUNNING,
-            ]:
+            if updated == 0:
+                # 2. Single-column lookup only on the failure path
+                current_status = (
+                    wiki_db.query(WikiGeneration.status)
+                    .filter(
+                        WikiGeneration.id == generation_id,
+                        WikiGeneration.user_id == user_id,
+                    )
+                    .scalar()
+                )
+                if current_status is None:
+                    raise HTTPException(status_code=404, detail="Generation not found")
                 raise HTTPException(
                     status_code=400,
-                    detail=f"Cannot cancel generation with status {generation.status}. Only PENDING or RUNNING generations can be cancelled.",
+                    detail=f"Cannot cancel generation with status {current_status}. Only PENDING or RUNNING generations can be cancelled.",
                 )
 
-            # 3. Stop related task execution first (before updating generation status)
-            if generation.task_id:
-                try:
-                    # Delete the task to stop execution
-                    task_kinds_service.delete_task(
-                        db=main_db, task_id=generation.task_id, user_id=user_id
-                    )
-                    logger.info(
-                        f"Stopped task {generation.task_id} for generation {generation_id}"
-                    )
-                except HTTPException as e:
-                    # If task not found (404), it's already deleted, continue with cancellation
-                    if e.status_code == 404:
-                        logger.warning(
-                            f"Task {generation.task_id} not found, already deleted. Continuing with cancellation."
-                        )
-                    else:
-                        # For other HTTP errors, raise the error
-                        logger.error(
-                            f"Failed to stop task {generation.task_id}: {str(e)}"
-                        )
-                        raise
-                except Exception as e:
-                    # For unexpected errors, log warning but continue with cancellation
-                    logger.warning(
-                        f"Error stopping task {generation.task_id}: {str(e)}. Continuing with cancellation."
-                    )
-
-            # 4. Update generation status to CANCELLED (only after task is stopped)
-            generation.status = WikiGenerationStatus.CANCELLED
-            generation.completed_at = func.now()
-
-            wiki_db.commit()
-            wiki_db.refresh(generation)
-            main_db.commit()
-
-            logger.info(f"Cancelled wiki generation {generation_id}")
-
-            return generation
+            generation = (
+                wiki_db.query(WikiGeneration)
+                .filter(WikiGeneration.id == generation_id)
+                .first()
+            )
 
         except HTTPException:
             wiki_db.rollback()
-            main_db.rollback()
             raise
         except Exception as e:
             wiki_db.rollback()
-            main_db.rollback()
             logger.error(f"Failed to cancel generation {generation_id}: {e}")
             raise HTTPException(
                 status_code=500, detail=f"Failed to cancel generation: {str(e)}"
             )
+
+        # 3. Stop related task execution outside the wiki transaction
+        if generation.task_id:
+            try:
+                self._stop_generation_task(generation.task_id, user_id, main_db)
+                logger.info(
+                    f"Stopped task {generation.task_id} for generation {generation_id}"
+                )
+            except HTTPException as e:
+                # If task not found (404), it's already deleted, keep the cancellation
+                if e.status_code != 404:
+                    # 4. The task keeps running, so undo the cancellation
+                    logger.error(f"Failed to stop task {generation.task_id}: {str(e)}")
+                    self._restore_generation_status(wiki_db, generation)
+                    raise
+                logger.warning(
+                    f"Task {generation.task_id} not found, already deleted. Continuing with cancellation."
+                )
+            except Exception as e:
+                # For unexpected errors, log warning but keep the cancellation
+                logger.warning(
+                    f"Error stopping task {generation.task_id}: {str(e)}. Continuing with cancellation."
+                )
+
+        logger.info(f"Cancelled wiki generation {generation_id}")
+
+        return generation
+
+    def _stop_generation_task(
+        self, task_id: int, user_id: int, main_db: Optional[Session] = None
+    ) -> None:
+        """
+        Delete a generation's task in its own session.
+
+        delete_task commits on the session it is given, so a failure there must
+        not leave the wiki session in a failed state.
+
+        Args:
+            task_id: Task to delete
+            user_id: Owner of the task
+            main_db: Session for task operations; a new one is opened if None
+        """
+        task_db = main_db if main_db is not None else SessionLocal()
+        try:
+            task_kinds_service.delete_task(db=task_db, task_id=task_id, user_id=user_id)
+        except Exception:
+            task_db.rollback()
+            raise
         finally:
-            main_db.close()
+            if main_db is None:
+                task_db.close()
+
+    def _restore_generation_status(
+        self, wiki_db: Session, generation: WikiGeneration
+    ) -> None:
+        """
+        Undo a cancellation whose task could not be stopped.
+
+        A generation gets its task_id when it is marked RUNNING, so a cancelled
+        generation with a task was RUNNING with the epoch completed_at. Only reverts
+        the row if it is still CANCELLED, so a later status change made by
+        someone else is kept.
+        """
+        try:
+            wiki_db.query(WikiGeneration).filter(
+                WikiGeneration.id == generation.id,
+                WikiGeneration.status == WikiGenerationStatus.CANCELLED,
+            ).update(
+                {
+                    WikiGeneration.status: WikiGenerationStatus.RUNNING,
+                    WikiGeneration.completed_at: datetime(1970, 1, 1, 0, 0, 0),
+                },
+                synchronize_session=False,
+            )
+            wiki_db.commit()
+            wiki_db.refresh(generation)
+        except Exception as e:
+            wiki_db.rollback()
+            logger.error(f"Failed to restore status of generation {generation.id}: {e}")
 
 
 wiki_service = WikiService()
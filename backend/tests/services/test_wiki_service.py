@@ -0,0 +1,735 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import sessionmaker
+
+from app.db.session import WikiBase
+from app.models.wiki import (
+    WikiContent,
+    WikiGeneration,
+    WikiGenerationStatus,
+    WikiProject,
+)
+from app.services.wiki_service import WikiService
+
+WIKI_TABLES = [
+    WikiProject.__table__,
+    WikiGeneration.__table__,
+    WikiContent.__table__,
+]
+
+
+@pytest.fixture
+def wiki_db():
+    """Create an in-memory SQLite session with only the wiki tables"""
+    engine = create_engine("sqlite://")
+    WikiBase.metadata.create_all(bind=engine, tables=WIKI_TABLES)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield db
+    finally:
+        db.close()
+        WikiBase.metadata.drop_all(bind=engine, tables=WIKI_TABLES)
+
+
+def _seed_generation(
+    db,
+    user_id: int = 1,
+    status: WikiGenerationStatus = WikiGenerationStatus.RUNNING,
+    content_titles=("Overview", "Architecture"),
+) -> WikiGeneration:
+    project = WikiProject(
+        project_name="Group/Repo",
+        source_url=f"https://gitlab.example.com/group/repo-{user_id}-{status}.git",
+        description="",
+        ext={},
+    )
+    db.add(project)
+    db.flush()
+    generation = WikiGeneration(
+        project_id=project.id,
+        user_id=user_id,
+        task_id=0,
+        team_id=1,
+        source_snapshot={},
+        status=status,
+        ext={},
+        completed_at=datetime(1970, 1, 1),
+    )
+    db.add(generation)
+    db.flush()
+    base_time = datetime(2025, 1, 1)
+    for index, title in enumerate(content_titles):
+        db.add(
+            WikiContent(
+                generation_id=generation.id,
+                title=title,
+                content=f"# {title}",
+                ext={},
+                created_at=base_time + timedelta(minutes=index),
+            )
+        )
+    db.commit()
+    return generation
+
+
+def _make_project(
+    project_id: int,
+    project_name: str,
+    source_type: str = "gitlab",
+    source_domain: str = "gitlab.example.com",
+    source_id: str = None,
+) -> WikiProject:
+    return WikiProject(
+        id=project_id,
+        project_name=project_name,
+        project_name_lower=project_name.lower(),
+        project_type="git",
+        source_type=source_type,
+        source_url=f"https://{source_domain}/{project_name}.git",
+        source_id=source_id,
+        source_domain=source_domain,
+    )
+
+
+def _make_user(git_info):
+    user = Mock()
+    user.id = 1
+    user.git_info = git_info
+    return user
+
+
+@pytest.mark.unit
+class TestWikiServiceFilterProjectsByUserAccess:
+    """Test WikiService._filter_projects_by_user_access method"""
+
+    def test_filter_returns_empty_without_git_info(self):
+        """Test users without git_info see no projects"""
+        service = WikiService()
+        projects = [_make_project(1, "group/repo")]
+
+        assert service._filter_projects_by_user_access(projects, _make_user([])) == []
+
+    def test_filter_empty_projects_skips_cache_lookup(self, mocker):
+        """Test an empty project list returns without reading Redis"""
+        service = WikiService()
+        batch_get = mocker.patch(
+            "app.services.wiki_service.cache_manager.get_user_repositories_batch_sync"
+        )
+        user = _make_user(
+            [{"type": "gitlab", "git_domain": "gitlab.com", "git_token": "token"}]
+        )
+
+        assert service._filter_projects_by_user_access([], user) == []
+        batch_get.assert_not_called()
+
+    def test_filter_matches_cached_repos_by_id_and_name(self, mocker):
+        """Test projects are matched against cached repos by ID and by name"""
+        service = WikiService()
+        mocker.patch(
+            "app.services.wiki_service.cache_manager.get_user_repositories_batch_sync",
+            return_value={
+                "gitlab.example.com": [
+                    {"id": 10, "full_name": "group/by-id"},
+                    {"id": 11, "full_name": "Group/By-Name"},
+                ]
+            },
+        )
+        api_check = mocker.patch.object(service, "_check_user_project_access_via_api")
+        user = _make_user(
+            [
+                {
+                    "type": "gitlab",
+                    "git_domain": "gitlab.example.com",
+                    "git_token": "token",
+                }
+            ]
+        )
+        projects = [
+            _make_project(1, "group/by-id", source_id="10"),
+            _make_project(2, "group/by-name"),
+            _make_project(3, "group/denied", source_id="99"),
+            _make_project(4, "owner/repo", source_type="github"),
+        ]
+
+        result = service._filter_projects_by_user_access(projects, user)
+
+        assert [p.id for p in result] == [1, 2]
+        api_check.assert_not_called()
+
+    def test_filter_fetches_all_domain_caches_in_one_batch(self, mocker):
+        """Test cached repositories for all configured domains are read in one call"""
+        service = WikiService()
+        batch_get = mocker.patch(
+            "app.services.wiki_service.cache_manager.get_user_repositories_batch_sync",
+            return_value={},
+        )
+        mocker.patch.object(
+            service, "_check_user_project_access_via_api", return_value=False
+        )
+        user = _make_user(
+            [
+                {"type": "gitlab", "git_domain": "gitlab.a.com", "git_token": "t1"},
+                {"type": "gitlab", "git_domain": "gitlab.b.com", "git_token": "t2"},
+                {"type": "github", "git_domain": "github.com", "git_token": "t3"},
+            ]
+        )
+
+        service._filter_projects_by_user_access([_make_project(1, "group/repo")], user)
+
+        batch_get.assert_called_once()
+        user_id, domains = batch_get.call_args.args
+        assert user_id == 1
+        assert sorted(domains) == ["github.com", "gitlab.a.com", "gitlab.b.com"]
+
+    def test_filter_uses_cache_from_other_domain_of_same_type(self, mocker):
+        """Test projects on unconfigured domains use any cached domain of the type"""
+        service = WikiService()
+        mocker.patch(
+            "app.services.wiki_service.cache_manager.get_user_repositories_batch_sync",
+            return_value={
+                "gitlab.example.com": [{"id": 10, "full_name": "group/repo"}]
+            },
+        )
+        api_check = mocker.patch.object(service, "_check_user_project_access_via_api")
+        user = _make_user(
+            [
+                {
+                    "type": "gitlab",
+                    "git_domain": "gitlab.example.com",
+                    "git_token": "token",
+                }
+            ]
+        )
+        projects = [
+            _make_project(1, "group/repo", source_domain="gitlab.other.com"),
+        ]
+
+        result = service._filter_projects_by_user_access(projects, user)
+
+        assert [p.id for p in result] == [1]
+        api_check.assert_not_called()
+
+    def test_filter_does_not_match_cache_of_another_configured_domain(self, mocker):
+        """Test repo IDs cached for one instance do not grant access on another"""
+        service = WikiService()
+        mocker.patch(
+            "app.services.wiki_service.cache_manager.get_user_repositories_batch_sync",
+            return_value={
+                "gitlab.a.com": [{"id": 1, "full_name": "group/other"}],
+                "gitlab.b.com": [{"id": 42, "full_name": "team/repo"}],
+            },
+        )
+        api_check = mocker.patch.object(service, "_check_user_project_access_via_api")
+        user = _make_user(
+            [
+                {"type": "gitlab", "git_domain": "gitlab.a.com", "git_token": "t1"},
+                {"type": "gitlab", "git_domain": "gitlab.b.com", "git_token": "t2"},
+            ]
+        )
+        projects = [
+            _make_project(
+                7, "group/repo", source_domain="gitlab.a.com", source_id="42"
+            ),
+            _make_project(8, "team/repo", source_domain="gitlab.b.com", source_id="42"),
+        ]
+
+        result = service._filter_projects_by_user_access(projects, user)
+
+        assert [p.id for p in result] == [8]
+        api_check.assert_not_called()
+
+    def test_filter_falls_back_to_api_for_uncached_domain(self, mocker):
+        """Test projects on a configured but uncached domain are checked via API"""
+        service = WikiService()
+        mocker.patch(
+            "app.services.wiki_service.cache_manager.get_user_repositories_batch_sync",
+            return_value={
+                "gitlab.example.com": [{"id": 10, "full_name": "group/repo"}],
+                "gitlab.internal.com": None,
+            },
+        )
+        api_check = mocker.patch.object(
+            service, "_check_user_project_access_via_api", return_value=True
+        )
+        user = _make_user(
+            [
+                {
+                    "type": "gitlab",
+                    "git_domain": "gitlab.example.com",
+                    "git_token": "token",
+                },
+                {
+                    "type": "gitlab",
+                    "git_domain": "gitlab.internal.com",
+                    "git_token": "token2",
+                },
+            ]
+        )
+        projects = [
+            _make_project(1, "group/repo", source_domain="gitlab.internal.com"),
+        ]
+
+        result = service._filter_projects_by_user_access(projects, user)
+
+        assert [p.id for p in result] == [1]
+        api_check.assert_called_once()
+
+    def test_filter_api_fallback_preserves_project_order(self, mocker):
+        """Test concurrent API fallback keeps accessible projects in input order"""
+        service = WikiService()
+        mocker.patch(
+            "app.services.wiki_service.cache_manager.get_user_repositories_batch_sync",
+            return_value={},
+        )
+        mocker.patch.object(
+            service,
+            "_check_user_project_access_via_api",
+            side_effect=lambda project, user_tokens: project.id % 2 == 1,
+        )
+        user = _make_user(
+            [
+                {
+                    "type": "gitlab",
+                    "git_domain": "gitlab.example.com",
+                    "git_token": "token",
+                }
+            ]
+        )
+        projects = [_make_project(i, f"group/repo-{i}") for i in range(1, 8)]
+
+        result = service._filter_projects_by_user_access(projects, user)
+
+        assert [p.id for p in result] == [1, 3, 5, 7]
+
+    def test_filter_api_fallback_checks_duplicate_repos_once(self, mocker):
+        """Test projects tracking the same repository share one API check"""
+        service = WikiService()
+        mocker.patch(
+            "app.services.wiki_service.cache_manager.get_user_repositories_batch_sync",
+            return_value={},
+        )
+        api_check = mocker.patch.object(
+            service, "_check_user_project_access_via_api", return_value=True
+        )
+        user = _make_user(
+            [
+                {
+                    "type": "gitlab",
+                    "git_domain": "gitlab.example.com",
+                    "git_token": "token",
+                }
+            ]
+        )
+        projects = [
+            _make_project(1, "group/repo", source_id="10"),
+            _make_project(2, "group/other"),
+            _make_project(3, "group/repo-renamed", source_id="10"),
+        ]
+
+        result = service._filter_projects_by_user_access(projects, user)
+
+        assert [p.id for p in result] == [1, 2, 3]
+        assert api_check.call_count == 2
+
+
+@pytest.mark.unit
+class TestWikiServiceGetGenerations:
+    """Test WikiService.get_generations method"""
+
+    def _mock_db(self, rows, count=None):
+        query = Mock()
+        query.filter.return_value = query
+        query.order_by.return_value = query
+        query.offset.return_value = query
+        query.limit.return_value = query
+        query.all.return_value = rows
+        query.count.return_value = count
+        db = Mock()
+        db.query.return_value = query
+        return db, query
+
+    def test_get_generations_skips_count_by_default(self):
+        """Test total is not counted unless requested and has_next uses limit+1"""
+        service = WikiService()
+        db, query = self._mock_db(rows=[1, 2, 3])
+
+        items, total, has_next = service.get_generations(
+            db=db, user_id=0, skip=0, limit=2
+        )
+
+        assert items == [1, 2]
+        assert total is None
+        assert has_next is True
+        query.count.assert_not_called()
+        query.limit.assert_called_once_with(3)
+
+    def test_get_generations_with_total(self):
+        """Test total is returned when include_total is set"""
+        service = WikiService()
+        db, query = self._mock_db(rows=[1], count=1)
+
+        items, total, has_next = service.get_generations(
+            db=db, user_id=1, skip=0, limit=2, include_total=True
+        )
+
+        assert items == [1]
+        assert total == 1
+        assert has_next is False
+
+
+@pytest.mark.unit
+class TestWikiServiceGetGenerationDetail:
+    """Test WikiService.get_generation_detail method"""
+
+    def test_get_generation_detail_with_contents(self, wiki_db):
+        """Test contents are eager-loaded in created_at order"""
+        service = WikiService()
+        generation = _seed_generation(wiki_db)
+        wiki_db.expire_all()
+
+        result = service.get_generation_detail(
+            wiki_db, generation.id, user_id=0, with_contents=True
+        )
+
+        assert [c.title for c in result.contents] == ["Overview", "Architecture"]
+
+    def test_get_generation_detail_contents_not_lazy_loaded(self, wiki_db):
+        """Test accessing contents without eager loading raises instead of querying"""
+        service = WikiService()
+        generation = _seed_generation(wiki_db)
+        wiki_db.expire_all()
+
+        result = service.get_generation_detail(wiki_db, generation.id, user_id=0)
+
+        with pytest.raises(InvalidRequestError):
+            result.contents
+
+
+@pytest.mark.unit
+class TestWikiServiceGetProjects:
+    """Test WikiService.get_projects access filtering"""
+
+    def _seed_projects(self, db):
+        projects = [
+            ("gitlab", "gitlab.example.com", "10", "group/by-id"),
+            ("gitlab", "gitlab.example.com", None, "Group/By-Name"),
+            ("gitlab", "gitlab.example.com", "99", "group/denied"),
+            ("gitlab", "gitlab.internal.com", "20", "team/internal"),
+            ("github", "github.com", None, "owner/repo"),
+        ]
+        base_time = datetime(2025, 1, 1)
+        for index, (source_type, domain, source_id, name) in enumerate(projects):
+            db.add(
+                WikiProject(
+                    project_name=name,
+                    source_type=source_type,
+                    source_url=f"https://{domain}/{name}.git",
+                    source_id=source_id,
+                    source_domain=domain,
+                    description="",
+                    ext={},
+                    created_at=base_time + timedelta(minutes=index),
+                )
+            )
+        db.commit()
+
+    def test_get_projects_without_matches_returns_empty(self, wiki_db, mocker):
+        """Test no projects are returned when none match the filters"""
+        service = WikiService()
+        mocker.patch(
+            "app.services.wiki_service.cache_manager.get_user_repositories_batch_sync",
+            return_value={"gitlab.com": [{"id": 10, "full_name": "group/repo"}]},
+        )
+        user = _make_user(
+            [{"type": "gitlab", "git_domain": "gitlab.com", "git_token": "token"}]
+        )
+
+        projects, total = service.get_projects(wiki_db, user=user)
+
+        assert (projects, total) == ([], 0)
+
+    def test_get_projects_paginates_cached_matches_in_sql(self, wiki_db, mocker):
+        """Test cached matches are filtered and paginated without API checks"""
+        service = WikiService()
+        self._seed_projects(wiki_db)
+        mocker.patch(
+            "app.services.wiki_service.cache_manager.get_user_repositories_batch_sync",
+            return_value={
+                "gitlab.example.com": [
+                    {"id": 10, "full_name": "group/by-id"},
+                    {"id": 11, "full_name": "group/by-name"},
+                ]
+            },
+        )
+        api_check = mocker.patch.object(service, "_check_user_project_access_via_api")
+        user = _make_user(
+            [
+                {
+                    "type": "gitlab",
+                    "git_domain": "gitlab.example.com",
+                    "git_token": "token",
+                }
+            ]
+        )
+
+        items, total = service.get_projects(wiki_db, user=user, skip=0, limit=1)
+
+        assert total == 2
+        assert [p.project_name for p in items] == ["Group/By-Name"]
+        api_check.assert_not_called()
+
+    def test_get_projects_keeps_cached_ids_per_domain(self, wiki_db, mocker):
+        """Test an ID cached for one instance does not match the same ID on another"""
+        service = WikiService()
+        for index, (domain, name) in enumerate(
+            [("gitlab.a.com", "group/repo"), ("gitlab.b.com", "team/repo")]
+        ):
+            wiki_db.add(
+                WikiProject(
+                    project_name=name,
+                    source_type="gitlab",
+                    source_url=f"https://{domain}/{name}.git",
+                    source_id="42",
+                    source_domain=domain,
+                    description="",
+                    ext={},
+                    created_at=datetime(2025, 1, 1) + timedelta(minutes=index),
+                )
+            )
+        wiki_db.commit()
+        mocker.patch(
+            "app.services.wiki_service.cache_manager.get_user_repositories_batch_sync",
+            return_value={
+                "gitlab.a.com": [{"id": 1, "full_name": "group/other"}],
+                "gitlab.b.com": [{"id": 42, "full_name": "team/repo"}],
+            },
+        )
+        api_check = mocker.patch.object(service, "_check_user_project_access_via_api")
+        user = _make_user(
+            [
+                {"type": "gitlab", "git_domain": "gitlab.a.com", "git_token": "t1"},
+                {"type": "gitlab", "git_domain": "gitlab.b.com", "git_token": "t2"},
+            ]
+        )
+
+        items, total = service.get_projects(wiki_db, user=user, skip=0, limit=10)
+
+        assert total == 1
+        assert [p.source_domain for p in items] == ["gitlab.b.com"]
+        api_check.assert_not_called()
+
+    def test_get_projects_checks_uncached_candidates_via_api(self, wiki_db, mocker):
+        """Test only projects on uncached domains are sent to the API check"""
+        service = WikiService()
+        self._seed_projects(wiki_db)
+        mocker.patch(
+            "app.services.wiki_service.cache_manager.get_user_repositories_batch_sync",
+            return_value={
+                "gitlab.example.com": [{"id": 10, "full_name": "group/by-id"}],
+                "gitlab.internal.com": None,
+            },
+        )
+        api_check = mocker.patch.object(
+            service, "_check_user_project_access_via_api", return_value=True
+        )
+        user = _make_user(
+            [
+                {
+                    "type": "gitlab",
+                    "git_domain": "gitlab.example.com",
+                    "git_token": "token",
+                },
+                {
+                    "type": "gitlab",
+                    "git_domain": "gitlab.internal.com",
+                    "git_token": "token2",
+                },
+            ]
+        )
+
+        items, total = service.get_projects(wiki_db, user=user, skip=0, limit=10)
+
+        assert total == 2
+        assert [p.project_name for p in items] == ["group/by-id", "team/internal"]
+        assert [call.args[0].project_name for call in api_check.call_args_list] == [
+            "team/internal"
+        ]
+
+
+@pytest.mark.unit
+class TestWikiServiceCancelWikiGeneration:
+    """Test WikiService.cancel_wiki_generation method"""
+
+    def test_cancel_commits_before_stopping_task_in_own_session(self, wiki_db, mocker):
+        """Test the cancellation is committed before the task is deleted elsewhere"""
+        service = WikiService()
+        generation = _seed_generation(wiki_db, user_id=1)
+        generation.task_id = 42
+        wiki_db.commit()
+        task_db = Mock()
+        mocker.patch("app.services.wiki_service.SessionLocal", return_value=task_db)
+        commit = mocker.spy(wiki_db, "commit")
+        commits_before_delete = []
+        delete_task = mocker.patch(
+            "app.services.wiki_service.task_kinds_service.delete_task",
+            side_effect=lambda **kwargs: commits_before_delete.append(
+                commit.call_count
+            ),
+        )
+
+        result = service.cancel_wiki_generation(wiki_db, generation.id, user_id=1)
+
+        assert result.status == WikiGenerationStatus.CANCELLED
+        delete_task.assert_called_once_with(db=task_db, task_id=42, user_id=1)
+        assert commits_before_delete == [1]
+        task_db.close.assert_called_once()
+
+    def test_cancel_uses_caller_task_session(self, wiki_db, mocker):
+        """Test a provided main_db is used for the task and left open"""
+        service = WikiService()
+        generation = _seed_generation(wiki_db, user_id=1)
+        generation.task_id = 42
+        wiki_db.commit()
+        main_db = Mock()
+        session_local = mocker.patch("app.services.wiki_service.SessionLocal")
+        delete_task = mocker.patch(
+            "app.services.wiki_service.task_kinds_service.delete_task"
+        )
+
+        service.cancel_wiki_generation(
+            wiki_db, generation.id, user_id=1, main_db=main_db
+        )
+
+        delete_task.assert_called_once_with(db=main_db, task_id=42, user_id=1)
+        session_local.assert_not_called()
+        main_db.close.assert_not_called()
+
+    def test_cancel_keeps_status_when_task_session_fails(self, wiki_db, mocker):
+        """Test a DB error while deleting the task does not fail the cancellation"""
+        service = WikiService()
+        generation = _seed_generation(wiki_db, user_id=1)
+        generation.task_id = 42
+        wiki_db.commit()
+        task_db = Mock()
+        mocker.patch("app.services.wiki_service.SessionLocal", return_value=task_db)
+        mocker.patch(
+            "app.services.wiki_service.task_kinds_service.delete_task",
+            side_effect=RuntimeError("database is locked"),
+        )
+
+        result = service.cancel_wiki_generation(wiki_db, generation.id, user_id=1)
+
+        assert result.status == WikiGenerationStatus.CANCELLED
+        task_db.rollback.assert_called_once()
+        task_db.close.assert_called_once()
+        wiki_db.expire_all()
+        assert wiki_db.get(WikiGeneration, generation.id).status == (
+            WikiGenerationStatus.CANCELLED
+        )
+
+    def test_cancel_missing_generation_raises_404(self, wiki_db):
+        """Test cancelling another user's generation returns 404"""
+        service = WikiService()
+        generation = _seed_generation(wiki_db, user_id=1)
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.cancel_wiki_generation(wiki_db, generation.id, user_id=2)
+
+        assert exc_info.value.status_code == 404
+        wiki_db.expire_all()
+        assert wiki_db.get(WikiGeneration, generation.id).status == (
+            WikiGenerationStatus.RUNNING
+        )
+
+    def test_cancel_completed_generation_raises_400(self, wiki_db):
+        """Test only PENDING or RUNNING generations can be cancelled"""
+        service = WikiService()
+        generation = _seed_generation(
+            wiki_db, user_id=1, status=WikiGenerationStatus.COMPLETED
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.cancel_wiki_generation(wiki_db, generation.id, user_id=1)
+
+        assert exc_info.value.status_code == 400
+        assert "COMPLETED" in exc_info.value.detail
+
+    def test_cancel_restores_status_when_task_stop_fails(self, wiki_db, mocker):
+        """Test the cancellation is undone if the task cannot be stopped"""
+        service = WikiService()
+        generation = _seed_generation(wiki_db, user_id=1)
+        generation.task_id = 42
+        wiki_db.commit()
+        mocker.patch("app.services.wiki_service.SessionLocal", return_value=Mock())
+        mocker.patch(
+            "app.services.wiki_service.task_kinds_service.delete_task",
+            side_effect=HTTPException(status_code=403, detail="Forbidden"),
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.cancel_wiki_generation(wiki_db, generation.id, user_id=1)
+
+        assert exc_info.value.status_code == 403
+        wiki_db.expire_all()
+        restored = wiki_db.get(WikiGeneration, generation.id)
+        assert restored.status == WikiGenerationStatus.RUNNING
+        assert restored.completed_at == datetime(1970, 1, 1, 0, 0, 0)
+
+
+@pytest.mark.unit
+class TestWikiServiceGetGenerationContentHeaders:
+    """Test WikiService.get_generation_content_headers method"""
+
+    def test_get_content_headers_excludes_body(self, wiki_db):
+        """Test headers are returned in order without the content column"""
+        service = WikiService()
+        generation = _seed_generation(wiki_db)
+
+        headers = service.get_generation_content_headers(
+            wiki_db, generation.id, user_id=0
+        )
+
+        assert [h.title for h in headers] == ["Overview", "Architecture"]
+        assert "content" not in headers[0]._fields
+
+    def test_get_content_headers_missing_generation_raises_404(self, wiki_db):
+        """Test unknown generation IDs return 404"""
+        service = WikiService()
+
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_generation_content_headers(wiki_db, 999, user_id=0)
+
+        assert exc_info.value.status_code == 404
+
+
+@pytest.mark.unit
+class TestWikiServiceGetGenerationContents:
+    """Test WikiService.get_generation_contents method"""
+
+    def test_get_contents_filters_by_owner(self, wiki_db):
+        """Test contents are returned for the owner and hidden from others"""
+        service = WikiService()
+        generation = _seed_generation(wiki_db, user_id=1)
+
+        contents = service.get_generation_contents(wiki_db, generation.id, user_id=1)
+
+        assert [c.title for c in contents] == ["Overview", "Architecture"]
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_generation_contents(wiki_db, generation.id, user_id=2)
+        assert exc_info.value.status_code == 404
+
+    def test_get_contents_empty_generation_returns_empty_list(self, wiki_db):
+        """Test an existing generation without contents returns an empty list"""
+        service = WikiService()
+        generation = _seed_generation(wiki_db, content_titles=())
+
+        assert service.get_generation_contents(wiki_db, generation.id, user_id=0) == []
@@ -14,6 +14,7 @@
 CREATE TABLE IF NOT EXISTS wiki_projects (
     id INT AUTO_INCREMENT PRIMARY KEY COMMENT 'Primary key auto increment ID',
     project_name VARCHAR(200) NOT NULL DEFAULT '' COMMENT 'Project name',
+    project_name_lower VARCHAR(200) NOT NULL DEFAULT '' COMMENT 'Lowercased project name for case-insensitive matching',
     project_type VARCHAR(50) NOT NULL DEFAULT 'git' COMMENT 'Project type: git, local, etc',
     source_type VARCHAR(50) NOT NULL DEFAULT 'github' COMMENT 'Source type: github, gitlab, gitee, etc',
     source_url VARCHAR(500) NOT NULL DEFAULT '' COMMENT 'Source repository URL',
@@ -27,6 +28,7 @@ CREATE TABLE IF NOT EXISTS wiki_projects (
 
     UNIQUE KEY uniq_source_url (source_url),
     INDEX idx_project_name (project_name),
+    INDEX idx_project_name_lower (project_name_lower),
     INDEX idx_project_type (project_type),
     INDEX idx_source_type (source_type)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
@@ -6,15 +6,20 @@
 
 # -*- coding: utf-8 -*-
 
+import functools
 import json
 import os
 import re
-from typing import Dict, Any, Optional
+from collections.abc import Mapping
+from typing import Dict, Any, Optional, Tuple
 from shared.logger import setup_logger
 from shared.utils.sensitive_data_masker import mask_sensitive_data
 
 logger = setup_logger("agno_config_utils")
 
+# Placeholders in format ${source_spec}
+_PLACEHOLDER_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
 
 def resolve_value_from_source(data_sources: Dict[str, Dict[str, Any]], source_spec: str) -> str:
     """
@@ -50,7 +55,7 @@ def resolve_value_from_source(data_sources: Dict[str, Dict[str, Any]], source_sp
         current = data
 
         for key in keys:
-            if isinstance(current, dict) and key in current:
+            if isinstance(current, Mapping) and key in current:
                 current = current[key]
             elif isinstance(current, list) and key.isdigit() and int(key) < len(current):
                 current = current[int(key)]
@@ -62,6 +67,43 @@ def resolve_value_from_source(data_sources: Dict[str, Dict[str, Any]], source_sp
         return ""
 
 
+@functools.lru_cache(maxsize=256)
+def parse_placeholder_template(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """
+    Split a template into literal text and placeholder source specs, memoized per template
+
+    Args:
+        template: The template string with placeholders like ${agent_config.env.user}
+
+    Returns:
+        Tuple of (literal, source_spec) parts; source_spec is None for the trailing literal
+    """
+    parts = []
+    pos = 0
+    for match in _PLACEHOLDER_PATTERN.finditer(template):
+        parts.append((template[pos:match.start()], match.group(1)))
+        pos = match.end()
+    parts.append((template[pos:], None))
+    return tuple(parts)
+
+
+def render_placeholder_template(parts: Tuple[Tuple[str, Optional[str]], ...], data_sources: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Render a template pre-parsed by parse_placeholder_template
+
+    Args:
+        parts: Parsed (literal, source_spec) parts
+        data_sources: Dictionary containing all available data sources
+
+    Returns:
+        The template with placeholders replaced with actual values
+    """
+    return "".join(
+        literal + resolve_value_from_source(data_sources, source_spec) if source_spec is not None else literal
+        for literal, source_spec in parts
+    )
+
+
 def replace_placeholders_with_sources(template: str, data_sources: Dict[str, Dict[str, Any]]) -> str:
     """
     Replace placeholders in template with values from multiple data sources
@@ -73,17 +115,9 @@ def replace_placeholders_with_sources(template: str, data_sources: Dict[str, Dic
     Returns:
         The template with placeholders replaced with actual values
     """
-    # Find all placeholders in format ${source_spec}
-    pattern = r'\$\{([^}]+)\}'
-
     logger.info(f"data_sources:{data_sources}, template:{template}")
 
-    def replace_match(match):
-        source_spec = match.group(1)
-        value = resolve_value_from_source(data_sources, source_spec)
-        return value
-
-    return re.sub(pattern, replace_match, template)
+    return render_placeholder_template(parse_placeholder_template(template), data_sources)
 
 
 class ConfigManager:
@@ -100,6 +134,9 @@ class ConfigManager:
         """
         self.executor_env = self._parse_executor_env(executor_env)
         self.default_headers = self._parse_default_headers()
+        # Parsed header templates and the default_headers dict they were parsed from
+        self._header_templates: Dict[str, Tuple[Tuple[str, Optional[str]], ...]] = {}
+        self._header_templates_source: Optional[Dict[str, Any]] = None
     
     def _parse_executor_env(self, executor_env) -> Dict[str, Any]:
         """
@@ -160,6 +197,24 @@ class ConfigManager:
         
         return default_headers
     
+    def _get_header_templates(self) -> Dict[str, Tuple[Tuple[str, Optional[str]], ...]]:
+        """
+        Get parsed placeholder templates for string header values
+        
+        Templates are parsed once and re-parsed only when default_headers is replaced.
+        
+        Returns:
+            Dict mapping header names to parsed template parts
+        """
+        if self._header_templates_source is not self.default_headers:
+            self._header_templates = {
+                k: parse_placeholder_template(v)
+                for k, v in self.default_headers.items()
+                if isinstance(v, str)
+            }
+            self._header_templates_source = self.default_headers
+        return self._header_templates
+    
     def build_default_headers_with_placeholders(self, data_sources: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Build default headers with placeholder replacement
@@ -173,10 +228,12 @@ class ConfigManager:
         default_headers = {}
         try:
             # Apply placeholder replacement on individual string values inside the dict
+            header_templates = self._get_header_templates()
             replaced = {}
             for k, v in self.default_headers.items():
-                if isinstance(v, str):
-                    replaced[k] = replace_placeholders_with_sources(v, data_sources)
+                parts = header_templates.get(k)
+                if parts is not None:
+                    replaced[k] = render_placeholder_template(parts, data_sources)
                 else:
                     replaced[k] = v
             default_headers = replaced
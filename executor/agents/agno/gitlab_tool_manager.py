@@ -6,14 +6,229 @@
 
 # -*- coding: utf-8 -*-
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence, Tuple
+import asyncio
+import functools
+import hashlib
+import itertools
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
 import gitlab
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
 from shared.logger import setup_logger
 from shared.utils.crypto import is_token_encrypted, decrypt_git_token
 
 logger = setup_logger("agno_gitlab_tool_manager")
 
+# Shared result for managers without a client, avoids a fresh list per agent
+_EMPTY_TOOLS: Tuple[Any, ...] = ()
+
+# Worker count for bulk tools; kept below the shared adapter's pool_maxsize
+BULK_MAX_WORKERS = 8
+
+# Per-manager LRU cache of file contents, bounded by entry count and total characters
+FILE_CACHE_MAX_ENTRIES = 128
+FILE_CACHE_MAX_CHARS = 8 * 1024 * 1024
+
+# Shared HTTP adapter so every GitLab client reuses pooled keep-alive connections
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+
+
+def _new_session() -> requests.Session:
+    """
+    Create a requests session for one GitLab client on top of the shared adapter
+    
+    Sessions are per client so cookies set by one user's GitLab responses are
+    never replayed for another user or token; only the connection pools are shared.
+    
+    Returns:
+        New session with the shared adapter mounted for http and https
+    """
+    session = requests.Session()
+    session.mount("https://", _HTTP_ADAPTER)
+    session.mount("http://", _HTTP_ADAPTER)
+    return session
+
+
+# Authenticated clients shared across manager instances, keyed by (git_domain, token_hash)
+CLIENT_CACHE_TTL_SECONDS = 3600
+_CLIENT_CACHE: Dict[Tuple[str, str], Tuple[float, gitlab.Gitlab]] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# (git_domain, token_hash) pairs whose authentication was rejected, with the failure time
+AUTH_FAIL_CACHE_TTL_SECONDS = 60.0
+_AUTH_FAIL_CACHE: Dict[Tuple[str, str], float] = {}
+
+
+def _get_authenticated_client(git_domain: str, gitlab_url: str, git_token: str) -> Optional[gitlab.Gitlab]:
+    """
+    Get an authenticated GitLab client, reusing a cached one for the same domain and token
+    
+    Args:
+        git_domain: Git domain the token belongs to
+        gitlab_url: GitLab base URL
+        git_token: Decrypted GitLab token
+        
+    Returns:
+        Authenticated GitLab client, or None if the token was rejected within
+        the last AUTH_FAIL_CACHE_TTL_SECONDS
+    """
+    cache_key = (git_domain, hashlib.sha256(git_token.encode("utf-8")).hexdigest())
+    now = time.monotonic()
+    with _CLIENT_CACHE_LOCK:
+        cached = _CLIENT_CACHE.get(cache_key)
+        if cached and now - cached[0] < CLIENT_CACHE_TTL_SECONDS:
+            return cached[1]
+        failed_at = _AUTH_FAIL_CACHE.get(cache_key)
+        if failed_at is not None and now - failed_at < AUTH_FAIL_CACHE_TTL_SECONDS:
+            return None
+    
+    # Authenticate outside the lock so slow handshakes don't block other domains
+    client = gitlab.Gitlab(gitlab_url, private_token=git_token, session=_new_session())
+    try:
+        client.auth()
+    except gitlab.exceptions.GitlabAuthenticationError:
+        # Remember rejected tokens so new managers skip the round trip and error burst
+        with _CLIENT_CACHE_LOCK:
+            for key in [k for k, ts in _AUTH_FAIL_CACHE.items() if now - ts >= AUTH_FAIL_CACHE_TTL_SECONDS]:
+                del _AUTH_FAIL_CACHE[key]
+            _AUTH_FAIL_CACHE[cache_key] = now
+        raise
+    
+    with _CLIENT_CACHE_LOCK:
+        # Evict expired entries to keep the cache bounded by live (domain, token) pairs
+        expired_keys = [
+            key for key, (created_at, _) in _CLIENT_CACHE.items()
+            if now - created_at >= CLIENT_CACHE_TTL_SECONDS
+        ]
+        for key in expired_keys:
+            del _CLIENT_CACHE[key]
+        _CLIENT_CACHE[cache_key] = (now, client)
+        _AUTH_FAIL_CACHE.pop(cache_key, None)
+    return client
+
+
+# Raw tokens read from ~/.ssh/{domain}, keyed by path and invalidated by mtime
+_TOKEN_FILE_CACHE: Dict[str, Tuple[float, str]] = {}
+_TOKEN_FILE_CACHE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=64)
+def _decrypt_token(token: str) -> Optional[str]:
+    """
+    Decrypt a git token if it is encrypted, memoized per token value
+    
+    Args:
+        token: Raw token, encrypted or plain
+        
+    Returns:
+        Plain text token
+    """
+    if is_token_encrypted(token):
+        return decrypt_git_token(token)
+    return token
+
+
+@functools.lru_cache(maxsize=32)
+def _token_file_for(git_domain: str) -> Optional[str]:
+    """
+    Resolve the token file path of a domain, memoized per process
+    
+    Call _token_file_for.cache_clear() (or clear_client_cache()) to pick up
+    token files created after the first lookup.
+    
+    Args:
+        git_domain: Git domain
+        
+    Returns:
+        Path of ~/.ssh/{git_domain} if it exists, otherwise None
+    """
+    token_path = os.path.expanduser(f"~/.ssh/{git_domain}")
+    return token_path if os.path.exists(token_path) else None
+
+
+def _read_token_file(token_path: str) -> str:
+    """
+    Read a token file, reusing the content until the file changes
+    
+    Args:
+        token_path: Path of the token file
+        
+    Returns:
+        Raw token, possibly encrypted
+    """
+    mtime = os.stat(token_path).st_mtime
+    with _TOKEN_FILE_CACHE_LOCK:
+        cached = _TOKEN_FILE_CACHE.get(token_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    # Raw fd read skips the buffered text layer for this small, single-read file
+    fd = os.open(token_path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    try:
+        raw_token = os.read(fd, 4096)
+    finally:
+        os.close(fd)
+    
+    token = raw_token.decode("utf-8").strip()
+    with _TOKEN_FILE_CACHE_LOCK:
+        _TOKEN_FILE_CACHE[token_path] = (mtime, token)
+    return token
+
+
+# GitLab domain -> raw token maps built from user_config["git_info"], keyed by id(user_config).
+# The config object is kept alongside the map so a reused id can never match a different dict.
+_USER_TOKEN_MAP_MAX_ENTRIES = 64
+_USER_TOKEN_MAP: Dict[int, Tuple[Dict[str, Any], Dict[str, str]]] = {}
+_USER_TOKEN_MAP_LOCK = threading.Lock()
+
+
+def _get_gitlab_token_map(user_config: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Get the GitLab domain -> raw token map of a user config, built once per config
+    
+    Args:
+        user_config: User configuration containing a git_info list
+        
+    Returns:
+        Dict mapping GitLab domains to raw (possibly encrypted) tokens
+    """
+    key = id(user_config)
+    with _USER_TOKEN_MAP_LOCK:
+        cached = _USER_TOKEN_MAP.get(key)
+        if cached and cached[0] is user_config:
+            return cached[1]
+    
+    token_map: Dict[str, str] = {}
+    for info in user_config.get("git_info") or []:
+        # Tolerate malformed entries (non-dict items, None fields) instead of failing
+        if isinstance(info, dict) and (info.get("type") or "").lower() == "gitlab":
+            # Keep the first entry per domain, matching the previous linear scan
+            token_map.setdefault(info.get("git_domain") or "", info.get("git_token") or "")
+    
+    with _USER_TOKEN_MAP_LOCK:
+        if len(_USER_TOKEN_MAP) >= _USER_TOKEN_MAP_MAX_ENTRIES:
+            _USER_TOKEN_MAP.clear()
+        _USER_TOKEN_MAP[key] = (user_config, token_map)
+    return token_map
+
+
+def clear_client_cache() -> None:
+    """
+    Drop all cached GitLab clients and token lookups, and close pooled connections
+    """
+    with _CLIENT_CACHE_LOCK:
+        _CLIENT_CACHE.clear()
+        _AUTH_FAIL_CACHE.clear()
+    _token_file_for.cache_clear()
+    _HTTP_ADAPTER.close()
+
 
 class GitLabToolManager:
     """
@@ -32,9 +247,44 @@ class GitLabToolManager:
         self.gitlab_client: Optional[gitlab.Gitlab] = None
         self.git_domain = task_data.get("git_domain")
         self.git_repo_id = task_data.get("git_repo_id")
+        self.git_repo = task_data.get("git_repo")
         self.branch_name = task_data.get("branch_name", "main")
+        self._project = None
+        # Project-relative files endpoint, quoted once instead of on every raw read
+        self._files_base = f"/projects/{quote(str(self.git_repo_id), safe='')}/repository/files"
+        self._file_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._file_cache_chars = 0
+        self._file_cache_lock = threading.Lock()
         self._initialize_client()
     
+    @staticmethod
+    def is_available(task_data: Dict[str, Any]) -> bool:
+        """
+        Check whether task_data provides a GitLab domain and a token source
+        
+        This is a cheap pre-check that neither decrypts the token nor contacts GitLab,
+        so callers can skip constructing a manager when GitLab cannot be configured.
+        
+        Args:
+            task_data: Task data dictionary containing GitLab configuration
+            
+        Returns:
+            True if a token may be resolved for the task's git_domain, False on
+            missing or malformed input
+        """
+        git_domain = task_data.get("git_domain")
+        if not git_domain or not isinstance(git_domain, str):
+            return False
+        
+        user_config = task_data.get("user") or {}
+        if not isinstance(user_config, dict):
+            return False
+        if user_config.get("git_domain") == git_domain and user_config.get("git_token"):
+            return True
+        if _get_gitlab_token_map(user_config).get(git_domain):
+            return True
+        return _token_file_for(git_domain) is not None
+    
     def _initialize_client(self) -> None:
         """
         Initialize GitLab client using credentials from task_data
@@ -47,42 +297,32 @@ class GitLabToolManager:
         try:
             # Get GitLab token from user config
             # In executor context, git_token and git_domain are directly in user_config top level
+            # Every source yields the raw token; decryption happens once below
             user_config = self.task_data.get("user", {})
-            git_token = None
+            token_raw = None
             
             # Directly read from user_config top level (executor context)
             user_domain = user_config.get("git_domain", "")
             if user_domain == self.git_domain:
-                git_token = user_config.get("git_token", "")
+                token_raw = user_config.get("git_token", "")
             
             # If not found, try git_info list (backend style, fallback)
-            if not git_token:
-                git_info_list = user_config.get("git_info", [])
-                for info in git_info_list:
-                    info_type = info.get("type", "").lower()
-                    info_domain = info.get("git_domain", "")
-                    if info_type == "gitlab" and info_domain == self.git_domain:
-                        git_token = info.get("git_token", "")
-                        break
+            if not token_raw:
+                token_raw = _get_gitlab_token_map(user_config).get(self.git_domain, "")
             
             # If still not found, try to read from file system (fallback)
-            if not git_token:
-                token_path = os.path.expanduser(f"~/.ssh/{self.git_domain}")
-                if os.path.exists(token_path):
+            if not token_raw:
+                token_path = _token_file_for(self.git_domain)
+                if token_path:
                     try:
-                        with open(token_path, "r", encoding="utf-8") as f:
-                            token = f.read().strip()
-                            if is_token_encrypted(token):
-                                git_token = decrypt_git_token(token)
-                            else:
-                                git_token = token
+                        token_raw = _read_token_file(token_path)
                     except Exception as e:
                         logger.warning(f"Failed to read token from {token_path}: {e}")
             
-            # Process token if found
-            if git_token and git_token != "***":
-                if is_token_encrypted(git_token):
-                    git_token = decrypt_git_token(git_token)
+            # Decrypt the selected token exactly once
+            git_token = token_raw
+            if token_raw and token_raw != "***":
+                git_token = _decrypt_token(token_raw)
             
             if not git_token:
                 logger.warning(f"No valid token found for {self.git_domain}, GitLab tools will not be available")
@@ -91,41 +331,79 @@ class GitLabToolManager:
             # Construct GitLab URL
             gitlab_url = f"https://{self.git_domain}" if not self.git_domain.startswith("http") else self.git_domain
             
-            # Initialize GitLab client
-            self.gitlab_client = gitlab.Gitlab(gitlab_url, private_token=git_token)
-            if self.gitlab_client:
-                self.gitlab_client.auth()
-            else:
-                logger.error(f"Failed to create GitLab client for domain: {self.git_domain}")
-                self.gitlab_client = None
+            # Initialize GitLab client, reusing an authenticated one when available
+            self.gitlab_client = _get_authenticated_client(self.git_domain, gitlab_url, git_token)
+            if self.gitlab_client is None:
+                logger.debug(f"Token for {self.git_domain} was recently rejected, GitLab tools will not be available")
         except Exception as e:
             logger.error(f"Failed to initialize GitLab client: {str(e)}")
             self.gitlab_client = None
     
     def _get_project(self):
         """
-        Get GitLab project instance
+        Get GitLab project instance, built once per manager and reused by every tool
+        
+        The project is constructed lazily: tool calls only need the project ID, so no
+        GET /projects/:id request is made. A missing project surfaces as an error
+        from the first tool call instead.
         
         Returns:
             GitLab project instance or None
         """
+        if self._project is not None:
+            return self._project
+        
         if not self.gitlab_client or not self.git_repo_id:
             return None
         
-        try:
-            return self.gitlab_client.projects.get(self.git_repo_id)
-        except Exception as e:
-            logger.error(f"Failed to get GitLab project {self.git_repo_id}: {str(e)}")
-            return None
+        self._project = self.gitlab_client.projects.get(self.git_repo_id, lazy=True)
+        return self._project
+    
+    def _get_cached_file(self, branch: str, file_path: str) -> Optional[str]:
+        """
+        Get file content from the LRU cache, marking it as recently used
+        """
+        with self._file_cache_lock:
+            content = self._file_cache.get((branch, file_path))
+            if content is not None:
+                self._file_cache.move_to_end((branch, file_path))
+            return content
+    
+    def _cache_file(self, branch: str, file_path: str, content: str) -> None:
+        """
+        Store file content in the LRU cache, evicting least recently used entries
+        """
+        if len(content) > FILE_CACHE_MAX_CHARS:
+            return
+        with self._file_cache_lock:
+            previous = self._file_cache.pop((branch, file_path), None)
+            if previous is not None:
+                self._file_cache_chars -= len(previous)
+            self._file_cache[(branch, file_path)] = content
+            self._file_cache_chars += len(content)
+            while (
+                len(self._file_cache) > FILE_CACHE_MAX_ENTRIES
+                or self._file_cache_chars > FILE_CACHE_MAX_CHARS
+            ):
+                _, evicted = self._file_cache.popitem(last=False)
+                self._file_cache_chars -= len(evicted)
+    
+    def _invalidate_branch_cache(self, branch: str) -> None:
+        """
+        Drop cached file contents of a branch
+        """
+        with self._file_cache_lock:
+            for key in [key for key in self._file_cache if key[0] == branch]:
+                self._file_cache_chars -= len(self._file_cache.pop(key))
     
     def read_gitlab_file(self, file_path: str, branch: Optional[str] = None) -> str:
         """
-        Read a file from GitLab repository
+        Read a file from GitLab repository.
         
         Args:
-            file_path: Path to the file in the repository
-            branch: Branch name (defaults to task_data branch_name)
-            
+            file_path: Path to the file in the repository (e.g., 'src/main.py')
+            branch: Optional branch name (defaults to current branch)
+        
         Returns:
             File content as string, or error message starting with "Error:" if failed
         """
@@ -138,24 +416,28 @@ class GitLabToolManager:
                 return f"Error: Failed to get GitLab project {self.git_repo_id}"
             
             branch = branch or self.branch_name
-            file_content = project.files.get(file_path, ref=branch)
-            
-            # Decode file content
-            import base64
-            content = base64.b64decode(file_content.content).decode('utf-8')
+            cached_content = self._get_cached_file(branch, file_path)
+            if cached_content is not None:
+                return cached_content
+            
+            # Fetch raw bytes directly instead of a JSON-wrapped base64 payload
+            raw_content = project.files.raw(file_path=file_path, ref=branch)
+            content = raw_content.decode('utf-8', errors='replace')
+            self._cache_file(branch, file_path, content)
             return content
         except gitlab.exceptions.GitlabGetError as e:
-            error_msg = f"Error: Failed to read file {file_path} from GitLab branch {branch}: {str(e)}"
-            logger.error(error_msg)
-            return error_msg
-        except Exception as e:
-            error_msg = f"Error: Unexpected error reading file {file_path} from GitLab: {str(e)}"
-            logger.error(error_msg)
-            return error_msg
+            logger.error("Error: Failed to read file %s from GitLab branch %s: %s", file_path, branch, e)
+            return f"Error: Failed to read file {file_path} from GitLab branch {branch}: {e}"
+        except (gitlab.exceptions.GitlabError, requests.RequestException) as e:
+            logger.error("Error: Unexpected error reading file %s from GitLab: %s", file_path, e)
+            return f"Error: Unexpected error reading file {file_path} from GitLab: {e}"
     
-    def list_gitlab_branches(self) -> str:
+    def list_gitlab_branches(self, limit: Optional[int] = None) -> str:
         """
-        List all branches in the GitLab repository
+        List all branches in the GitLab repository.
+        
+        Args:
+            limit: Optional maximum number of branches to return (defaults to all)
         
         Returns:
             Comma-separated list of branch names, or error message starting with "Error:" if failed
@@ -168,24 +450,26 @@ class GitLabToolManager:
             if not project:
                 return f"Error: Failed to get GitLab project {self.git_repo_id}"
             
-            branches = project.branches.list()
+            # Iterate pages of 100 lazily so later pages are only fetched when needed
+            branches = project.branches.list(iterator=True, per_page=100)
+            if limit:
+                branches = itertools.islice(branches, limit)
             branch_names = [branch.name for branch in branches]
             return ", ".join(branch_names)
-        except Exception as e:
-            error_msg = f"Error: Failed to list GitLab branches: {str(e)}"
-            logger.error(error_msg)
-            return error_msg
+        except (gitlab.exceptions.GitlabError, requests.RequestException) as e:
+            logger.error("Error: Failed to list GitLab branches: %s", e)
+            return f"Error: Failed to list GitLab branches: {e}"
     
     def list_gitlab_files(self, directory_path: str = "", branch: Optional[str] = None) -> str:
         """
-        List files in a directory from GitLab repository
+        List files and directories in a GitLab repository path.
         
         Args:
-            directory_path: Directory path (empty string for root)
-            branch: Branch name (defaults to task_data branch_name)
-            
+            directory_path: Directory path (empty string for root, e.g., 'src/')
+            branch: Optional branch name (defaults to current branch)
+        
         Returns:
-            Newline-separated list of file paths, or error message starting with "Error:" if failed
+            Newline-separated list of files and directories, or error message starting with "Error:" if failed
         """
         if not self.gitlab_client:
             return "Error: GitLab client not initialized"
@@ -196,27 +480,27 @@ class GitLabToolManager:
                 return f"Error: Failed to get GitLab project {self.git_repo_id}"
             
             branch = branch or self.branch_name
-            items = project.repository_tree(path=directory_path, ref=branch, recursive=False)
-            
-            file_list = []
-            for item in items:
-                item_type = "📁" if item['type'] == 'tree' else "📄"
-                file_list.append(f"{item_type} {item['path']}")
-            
-            return "\n".join(file_list) if file_list else "Directory is empty"
-        except Exception as e:
-            error_msg = f"Error: Failed to list files in GitLab directory {directory_path}: {str(e)}"
-            logger.error(error_msg)
-            return error_msg
+            # Lazily iterate 100-item pages (the server maximum) and format while streaming
+            items = project.repository_tree(
+                path=directory_path, ref=branch, recursive=False, iterator=True, per_page=100
+            )
+            file_list = "\n".join(
+                f"{'📁' if item['type'] == 'tree' else '📄'} {item['path']}" for item in items
+            )
+            
+            return file_list or "Directory is empty"
+        except (gitlab.exceptions.GitlabError, requests.RequestException) as e:
+            logger.error("Error: Failed to list files in GitLab directory %s: %s", directory_path, e)
+            return f"Error: Failed to list files in GitLab directory {directory_path}: {e}"
     
     def get_gitlab_file_info(self, file_path: str, branch: Optional[str] = None) -> str:
         """
-        Get file information (size, last commit, etc.) from GitLab repository
+        Get file information (last commit, author, etc.) from GitLab repository.
         
         Args:
             file_path: Path to the file in the repository
-            branch: Branch name (defaults to task_data branch_name)
-            
+            branch: Optional branch name (defaults to current branch)
+        
         Returns:
             File information as string
         """
@@ -233,28 +517,203 @@ class GitLabToolManager:
             
             if commits:
                 commit = commits[0]
-                info = f"File: {file_path}\n"
-                info += f"Last commit: {commit.id[:8]} by {commit.author_name}\n"
-                info += f"Date: {commit.committed_date}\n"
-                info += f"Message: {commit.message}"
-                return info
+                return self._format_file_info(
+                    file_path, commit.id, commit.author_name, commit.committed_date, commit.message
+                )
             else:
                 return f"No commit history found for {file_path}"
-        except Exception as e:
-            error_msg = f"Error getting file info for {file_path}: {str(e)}"
-            logger.error(error_msg)
-            return error_msg
+        except (gitlab.exceptions.GitlabError, requests.RequestException) as e:
+            logger.error("Error getting file info for %s: %s", file_path, e)
+            return f"Error getting file info for {file_path}: {e}"
     
-    def create_gitlab_branch(self, branch_name: str, source_branch: Optional[str] = None) -> str:
+    @staticmethod
+    def _format_file_info(file_path: str, sha: str, author_name: str, committed_date: str, message: str) -> str:
+        """
+        Format last-commit information of a file
+        """
+        info = f"File: {file_path}\n"
+        info += f"Last commit: {sha[:8]} by {author_name}\n"
+        info += f"Date: {committed_date}\n"
+        info += f"Message: {message}"
+        return info
+    
+    @staticmethod
+    def _join_bulk_results(file_paths: List[str], results) -> str:
+        """
+        Join per-file results under "=== path ===" headers, in input order
+        """
+        return "\n\n".join(
+            f"=== {path} ===\n{result}" for path, result in zip(file_paths, results)
+        )
+    
+    def _graphql_last_commits(self, file_paths: List[str], ref: str) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get the last commit of several paths with a single GraphQL request
+        
+        Args:
+            file_paths: Paths of the files in the repository
+            ref: Branch name or commit SHA
+            
+        Returns:
+            Last commit (sha, authorName, committedDate, message) of each path in input
+            order, or None for paths without history
+            
+        Raises:
+            gitlab.exceptions.GitlabError: If the request or the query fails
+        """
+        # One aliased tree field per path, with paths passed as variables
+        variable_defs = "".join(f", $p{i}: String" for i in range(len(file_paths)))
+        fields = " ".join(
+            f"f{i}: tree(path: $p{i}, ref: $ref) {{ lastCommit {{ sha authorName committedDate message }} }}"
+            for i in range(len(file_paths))
+        )
+        query = (
+            f"query($fullPath: ID!, $ref: String!{variable_defs}) "
+            f"{{ project(fullPath: $fullPath) {{ repository {{ {fields} }} }} }}"
+        )
+        variables = {"fullPath": self.git_repo, "ref": ref}
+        variables.update({f"p{i}": path for i, path in enumerate(file_paths)})
+        
+        result = self.gitlab_client.http_post(
+            f"{self.gitlab_client.url}/api/graphql",
+            post_data={"query": query, "variables": variables},
+        )
+        project = (result.get("data") or {}).get("project")
+        if result.get("errors") or not project:
+            raise gitlab.exceptions.GitlabError(f"GraphQL last commit query failed: {result.get('errors')}")
+        
+        repository = project.get("repository") or {}
+        return [(repository.get(f"f{i}") or {}).get("lastCommit") for i in range(len(file_paths))]
+    
+    def _run_bulk(self, func, file_paths: List[str], branch: Optional[str]) -> str:
         """
-        Create a new branch in GitLab repository
+        Run a single-file tool for several paths concurrently
         
         Args:
-            branch_name: Name of the new branch to create
-            source_branch: Source branch name (defaults to task_data branch_name or 'main')
+            func: Tool method taking (file_path, branch)
+            file_paths: Paths of the files in the repository
+            branch: Branch name (defaults to task_data branch_name)
             
         Returns:
-            Success message or error message
+            Results of every path, each under a "=== path ===" header, in input order
+        """
+        if not self.gitlab_client:
+            return "Error: GitLab client not initialized"
+        if not file_paths:
+            return "Error: No file paths provided"
+        
+        # Each call is a blocking HTTPS round trip; map() keeps results in input order
+        with ThreadPoolExecutor(max_workers=min(BULK_MAX_WORKERS, len(file_paths))) as executor:
+            results = executor.map(lambda path: func(path, branch), file_paths)
+            return self._join_bulk_results(file_paths, results)
+    
+    async def _read_gitlab_file_async(self, client: httpx.AsyncClient, file_path: str, branch: str) -> str:
+        """
+        Read a file through the raw files endpoint without blocking the event loop
+        
+        Args:
+            client: Async HTTP client authenticated for the GitLab API
+            file_path: Path to the file in the repository
+            branch: Branch name
+            
+        Returns:
+            File content as string, or error message starting with "Error:" if failed
+        """
+        cached_content = self._get_cached_file(branch, file_path)
+        if cached_content is not None:
+            return cached_content
+        
+        try:
+            response = await client.get(
+                f"{self._files_base}/{quote(file_path, safe='')}/raw",
+                params={"ref": branch},
+            )
+            response.raise_for_status()
+            content = response.content.decode('utf-8', errors='replace')
+            self._cache_file(branch, file_path, content)
+            return content
+        except httpx.HTTPStatusError as e:
+            logger.error("Error: Failed to read file %s from GitLab branch %s: %s", file_path, branch, e)
+            return f"Error: Failed to read file {file_path} from GitLab branch {branch}: {e}"
+        except httpx.HTTPError as e:
+            logger.error("Error: Unexpected error reading file %s from GitLab: %s", file_path, e)
+            return f"Error: Unexpected error reading file {file_path} from GitLab: {e}"
+    
+    async def read_gitlab_files(self, file_paths: List[str], branch: Optional[str] = None) -> str:
+        """
+        Read several files from GitLab repository in one call.
+        
+        All reads share one httpx.AsyncClient and run with asyncio.gather, so the
+        agent's event loop is not blocked while waiting on GitLab.
+        
+        Args:
+            file_paths: Paths of the files in the repository (e.g., ['src/main.py', 'README.md'])
+            branch: Optional branch name (defaults to current branch)
+        
+        Returns:
+            Content of every file under a "=== path ===" header; failed reads contain an "Error:" message
+        """
+        if not self.gitlab_client or not self.git_repo_id:
+            return "Error: GitLab client not initialized"
+        if not file_paths:
+            return "Error: No file paths provided"
+        
+        branch = branch or self.branch_name
+        async with httpx.AsyncClient(
+            base_url=self.gitlab_client.api_url,
+            headers={"PRIVATE-TOKEN": self.gitlab_client.private_token},
+            limits=httpx.Limits(max_connections=BULK_MAX_WORKERS),
+            timeout=30.0,
+        ) as client:
+            results = await asyncio.gather(
+                *(self._read_gitlab_file_async(client, path, branch) for path in file_paths)
+            )
+        return self._join_bulk_results(file_paths, results)
+    
+    def get_gitlab_files_info(self, file_paths: List[str], branch: Optional[str] = None) -> str:
+        """
+        Get file information (last commit, author, etc.) for several files in one call.
+        
+        Uses a single GraphQL request when the project path is known, and falls back
+        to concurrent per-file REST calls otherwise.
+        
+        Args:
+            file_paths: Paths of the files in the repository
+            branch: Optional branch name (defaults to current branch)
+        
+        Returns:
+            File information of every file under a "=== path ===" header
+        """
+        if self.gitlab_client and self.git_repo and file_paths:
+            try:
+                last_commits = self._graphql_last_commits(file_paths, branch or self.branch_name)
+                return self._join_bulk_results(
+                    file_paths,
+                    (
+                        self._format_file_info(
+                            path, commit["sha"], commit["authorName"], commit["committedDate"], commit["message"]
+                        )
+                        if commit
+                        else f"No commit history found for {path}"
+                        for path, commit in zip(file_paths, last_commits)
+                    ),
+                )
+            except (gitlab.exceptions.GitlabError, requests.RequestException, KeyError) as e:
+                # KeyError covers a lastCommit missing fields; anything else is a bug and propagates
+                logger.warning("GraphQL file info lookup failed, falling back to REST: %s", e)
+        
+        return self._run_bulk(self.get_gitlab_file_info, file_paths, branch)
+    
+    def create_gitlab_branch(self, branch_name: str, source_branch: Optional[str] = None) -> str:
+        """
+        Create a new branch in GitLab repository.
+        
+        Args:
+            branch_name: Name of the new branch to create (e.g., 'feature/new-feature')
+            source_branch: Source branch name (defaults to current branch or 'main')
+        
+        Returns:
+            Success message with branch information or error message
         """
         if not self.gitlab_client:
             return "Error: GitLab client not initialized"
@@ -266,6 +725,9 @@ class GitLabToolManager:
             
             source_branch = source_branch or self.branch_name or "main"
             
+            # A recreated branch may point elsewhere, drop anything cached under its name
+            self._invalidate_branch_cache(branch_name)
+            
             # Create branch
             branch = project.branches.create({
                 'branch': branch_name,
@@ -274,26 +736,24 @@ class GitLabToolManager:
             
             return f"Successfully created branch '{branch_name}' from '{source_branch}'. Branch URL: {branch.web_url if hasattr(branch, 'web_url') else 'N/A'}"
         except gitlab.exceptions.GitlabCreateError as e:
-            error_msg = f"Error creating branch {branch_name}: {str(e)}"
-            logger.error(error_msg)
-            return error_msg
+            logger.error("Error creating branch %s: %s", branch_name, e)
+            return f"Error creating branch {branch_name}: {e}"
         except Exception as e:
-            error_msg = f"Unexpected error creating branch {branch_name}: {str(e)}"
-            logger.error(error_msg)
-            return error_msg
+            logger.error("Unexpected error creating branch %s: %s", branch_name, e)
+            return f"Unexpected error creating branch {branch_name}: {e}"
     
     def create_gitlab_merge_request(self, source_branch: str, target_branch: str, title: str, description: str = "") -> str:
         """
-        Create a merge request (MR) in GitLab repository
+        Create a merge request (MR) in GitLab repository.
         
         Args:
-            source_branch: Source branch name
-            target_branch: Target branch name (usually 'main' or 'master')
+            source_branch: Source branch name (e.g., 'feature/new-feature')
+            target_branch: Target branch name (usually 'main', 'master', or 'develop')
             title: MR title
             description: MR description (optional)
-            
+        
         Returns:
-            MR information or error message
+            MR information (ID, URL, status) or error message
         """
         if not self.gitlab_client:
             return "Error: GitLab client not initialized"
@@ -313,15 +773,13 @@ class GitLabToolManager:
             
             return f"Successfully created merge request:\nMR ID: {mr.iid}\nTitle: {mr.title}\nURL: {mr.web_url}\nStatus: {mr.state}"
         except gitlab.exceptions.GitlabCreateError as e:
-            error_msg = f"Error creating merge request: {str(e)}"
-            logger.error(error_msg)
-            return error_msg
+            logger.error("Error creating merge request: %s", e)
+            return f"Error creating merge request: {e}"
         except Exception as e:
-            error_msg = f"Unexpected error creating merge request: {str(e)}"
-            logger.error(error_msg)
-            return error_msg
+            logger.error("Unexpected error creating merge request: %s", e)
+            return f"Unexpected error creating merge request: {e}"
     
-    def create_tools(self) -> List[Any]:
+    def create_tools(self) -> Sequence[Any]:
         """
         Create Agno SDK compatible tools for GitLab operations
         
@@ -330,88 +788,16 @@ class GitLabToolManager:
         """
         if not self.gitlab_client:
             logger.warning("GitLab client not available, skipping GitLab tools creation")
-            return []
+            return _EMPTY_TOOLS
         
-        # Create tool functions with proper annotations for Agno SDK
-        # Agno SDK expects functions with type hints and docstrings
-        tools = []
-        
-        # Read file tool
-        def read_file(file_path: str, branch: Optional[str] = None) -> str:
-            """Read a file from GitLab repository.
-            
-            Args:
-                file_path: Path to the file in the repository (e.g., 'src/main.py')
-                branch: Optional branch name (defaults to current branch)
-            
-            Returns:
-                File content as string, or error message starting with "Error:" if failed
-            """
-            return self.read_gitlab_file(file_path, branch)
-        
-        # List branches tool
-        def list_branches() -> str:
-            """List all branches in the GitLab repository.
-            
-            Returns:
-                Comma-separated list of branch names, or error message starting with "Error:" if failed
-            """
-            return self.list_gitlab_branches()
-        
-        # List files tool
-        def list_files(directory_path: str = "", branch: Optional[str] = None) -> str:
-            """List files and directories in a GitLab repository path.
-            
-            Args:
-                directory_path: Directory path (empty string for root, e.g., 'src/')
-                branch: Optional branch name (defaults to current branch)
-            
-            Returns:
-                Newline-separated list of files and directories, or error message starting with "Error:" if failed
-            """
-            return self.list_gitlab_files(directory_path, branch)
-        
-        # Get file info tool
-        def get_file_info(file_path: str, branch: Optional[str] = None) -> str:
-            """Get file information (last commit, author, etc.) from GitLab repository.
-            
-            Args:
-                file_path: Path to the file in the repository
-                branch: Optional branch name (defaults to current branch)
-            
-            Returns:
-                File information as string
-            """
-            return self.get_gitlab_file_info(file_path, branch)
-        
-        # Create branch tool
-        def create_branch(branch_name: str, source_branch: Optional[str] = None) -> str:
-            """Create a new branch in GitLab repository.
-            
-            Args:
-                branch_name: Name of the new branch to create (e.g., 'feature/new-feature')
-                source_branch: Source branch name (defaults to current branch or 'main')
-            
-            Returns:
-                Success message with branch information or error message
-            """
-            return self.create_gitlab_branch(branch_name, source_branch)
-        
-        # Create merge request tool
-        def create_merge_request(source_branch: str, target_branch: str, title: str, description: str = "") -> str:
-            """Create a merge request (MR) in GitLab repository.
-            
-            Args:
-                source_branch: Source branch name (e.g., 'feature/new-feature')
-                target_branch: Target branch name (usually 'main', 'master', or 'develop')
-                title: MR title
-                description: MR description (optional)
-            
-            Returns:
-                MR information (ID, URL, status) or error message
-            """
-            return self.create_gitlab_merge_request(source_branch, target_branch, title, description)
-        
-        tools.extend([read_file, list_branches, list_files, get_file_info, create_branch, create_merge_request])
-        return tools
-
+        # Agno SDK builds tools from the type hints and docstrings of these bound methods
+        return [
+            self.read_gitlab_file,
+            self.read_gitlab_files,
+            self.list_gitlab_branches,
+            self.list_gitlab_files,
+            self.get_gitlab_file_info,
+            self.get_gitlab_files_info,
+            self.create_gitlab_branch,
+            self.create_gitlab_merge_request,
+        ]
@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+import asyncio
 import json
 from datetime import timedelta
 # SPDX-FileCopyrightText: 2025 Weibo, Inc.
@@ -24,6 +25,21 @@ class MCPManager:
     def __init__(self, thinking_manager=None):
         self.connected_tools: List[MCPTools] = []
         self.thinking_manager = thinking_manager
+        # Tool setups keyed by MCP servers config, shared by every member using that config
+        self._tools_futures: Dict[str, asyncio.Future] = {}
+    
+    @staticmethod
+    def get_config_key(mcp_servers: Any) -> str:
+        """
+        Build a canonical cache key for an MCP servers configuration
+        
+        Args:
+            mcp_servers: MCP servers configuration (dict or list format)
+            
+        Returns:
+            Stable JSON string identifying the configuration
+        """
+        return json.dumps(mcp_servers, sort_keys=True, ensure_ascii=False, default=str)
     
     async def setup_mcp_tools(self, config: Dict[str, Any]) -> Optional[List[MCPTools]]:
         """
@@ -39,6 +55,54 @@ class MCPManager:
         if mcp_servers is None:
             return None
 
+        return await self.get_tools_cached(self.get_config_key(mcp_servers), mcp_servers)
+    
+    async def get_tools_cached(self, key: str, mcp_servers: Any) -> Optional[List[MCPTools]]:
+        """
+        Get MCP tools for a servers configuration, connecting them only once per key
+        
+        Concurrent first callers await the same in-flight setup instead of
+        connecting to the same servers again.
+        
+        Args:
+            key: Cache key from get_config_key
+            mcp_servers: MCP servers configuration to connect on a cache miss
+            
+        Returns:
+            List of MCP tools if successful, None otherwise
+        """
+        future = self._tools_futures.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._connect_mcp_tools(mcp_servers))
+            future.add_done_callback(lambda done: self._evict_failed_setup(key, done))
+            self._tools_futures[key] = future
+        
+        # Shield the shared setup so one cancelled caller does not cancel it for the others
+        mcp_tools_list = await asyncio.shield(future)
+        return list(mcp_tools_list) if mcp_tools_list is not None else None
+    
+    def _evict_failed_setup(self, key: str, future: asyncio.Future) -> None:
+        """
+        Drop a failed tool setup from the cache so the next member retries it
+        
+        Args:
+            key: Cache key of the setup
+            future: Finished setup future
+        """
+        failed = future.cancelled() or future.exception() is not None or future.result() is None
+        if failed and self._tools_futures.get(key) is future:
+            del self._tools_futures[key]
+    
+    async def _connect_mcp_tools(self, mcp_servers: Any) -> Optional[List[MCPTools]]:
+        """
+        Create and connect MCP tools for a servers configuration
+        
+        Args:
+            mcp_servers: MCP servers configuration (dict or list format)
+            
+        Returns:
+            List of MCP tools if successful, None otherwise
+        """
         mcp_tools_list = []
 
         try:
@@ -254,6 +318,7 @@ class MCPManager:
                 )
         
         self.connected_tools.clear()
+        self._tools_futures.clear()
     
     def get_connected_tools_count(self) -> int:
         """
@@ -6,7 +6,10 @@
 
 # -*- coding: utf-8 -*-
 
-from typing import Dict, Any, Optional, List
+import asyncio
+from collections import ChainMap
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 from agno.agent import Agent as AgnoSdkAgent
 from agno.db.sqlite import SqliteDb
 from shared.logger import setup_logger
@@ -19,13 +22,27 @@ from .repository_detector import RepositoryDetector
 
 logger = setup_logger("agno_member_builder")
 
+# Sentinel meaning "detect the tool type from task_data"
+_DETECT_TOOL_TYPE = object()
+
+# Agent options shared by every member built here
+_AGENT_DEFAULTS = MappingProxyType({
+    "add_name_to_context": True,
+    "add_datetime_to_context": True,
+    "add_history_to_context": True,
+    "num_history_runs": 3,
+    "telemetry": False,
+})
+
 
 class MemberBuilder:
     """
     Builds and manages individual team members with configurable options
     """
     
-    def __init__(self, db: SqliteDb, config_manager: ConfigManager, thinking_manager=None):
+    __slots__ = ("db", "config_manager", "mcp_manager", "_gitlab_tools", "_mcp_semaphore")
+    
+    def __init__(self, db: SqliteDb, config_manager: ConfigManager, thinking_manager=None, max_concurrent_members: int = 8):
         """
         Initialize member builder
         
@@ -33,104 +50,135 @@ class MemberBuilder:
             db: SQLite database instance
             config_manager: Configuration manager instance
             thinking_manager: Thinking step manager instance (optional)
+            max_concurrent_members: Maximum number of members setting up MCP tools at once
         """
         self.db = db
         self.config_manager = config_manager
         self.mcp_manager = MCPManager(thinking_manager)
+        # Caps concurrent MCP setup when members are created in parallel
+        self._mcp_semaphore = asyncio.Semaphore(max_concurrent_members)
+        # GitLab tools of the last task, reused by every member built for it
+        self._gitlab_tools: Optional[Tuple[Dict[str, Any], Sequence[Any]]] = None
+    
+    def _get_gitlab_tools(self, task_data: Dict[str, Any]) -> Sequence[Any]:
+        """
+        Get GitLab SDK tools for a task, creating the GitLabToolManager once per task_data
+        
+        Args:
+            task_data: Task data for member creation
+            
+        Returns:
+            GitLab tools, empty if GitLab is not available
+        """
+        if self._gitlab_tools is not None and self._gitlab_tools[0] is task_data:
+            return self._gitlab_tools[1]
+        
+        gitlab_tools = GitLabToolManager(task_data).create_tools()
+        self._gitlab_tools = (task_data, gitlab_tools)
+        return gitlab_tools
+    
+    async def _assemble_tools(self, config: Dict[str, Any], task_data: Dict[str, Any], member_label: str, tool_type: Any = _DETECT_TOOL_TYPE) -> Tuple[List[Any], Dict[str, Any]]:
+        """
+        Set up MCP tools, build default headers and load repository tools for a member
+        
+        Args:
+            config: Member configuration (or team options for the default member)
+            task_data: Task data for member creation
+            member_label: Label used in log messages (e.g., "member Alice")
+            tool_type: Pre-detected tool type (may be None); detected from task_data if omitted
+            
+        Returns:
+            Tuple of (all tools for the member, default headers for the model)
+        """
+        # Setup MCP tools if available
+        async with self._mcp_semaphore:
+            mcp_tools = await self.mcp_manager.setup_mcp_tools(config)
+        
+        # Prepare data sources for placeholder replacement
+        data_sources = {
+            "agent_config": config.get("agent_config", {}),
+            "options": config,
+            "executor_env": self.config_manager.executor_env,
+            "task_data": task_data
+        }
+        
+        # Build default headers with placeholders
+        default_headers = self.config_manager.build_default_headers_with_placeholders(data_sources)
+        
+        # Detect and load appropriate tools based on repository domain; mcp_tools is a
+        # fresh list per call, while GitLab tools are shared and copied into the result
+        if tool_type is _DETECT_TOOL_TYPE:
+            tool_type = RepositoryDetector.detect_tool_type(task_data)
+        
+        if tool_type == "github_mcp":
+            # Load GitHub MCP tools
+            all_tools = mcp_tools or []
+            if all_tools:
+                logger.info("Matched GitHub repository, loaded %d GitHub MCP tools for %s", len(all_tools), member_label)
+            else:
+                logger.warning("Matched GitHub repository but no GitHub MCP tools available for %s", member_label)
+        elif tool_type == "gitlab_sdk":
+            # Load GitLab SDK tools
+            all_tools = list(self._get_gitlab_tools(task_data))
+            if all_tools:
+                logger.info("Matched GitLab repository, loaded %d GitLab SDK tools for %s", len(all_tools), member_label)
+            else:
+                logger.warning("Matched GitLab repository but GitLab tools are not available for %s", member_label)
+        else:
+            # No match: try all tools, if none work, log error
+            # Only build the GitLab manager when a domain and token are configured
+            gitlab_tools = self._get_gitlab_tools(task_data) if GitLabToolManager.is_available(task_data) else ()
+            all_tools = [*(mcp_tools or ()), *gitlab_tools]
+            
+            if not all_tools:
+                supported = RepositoryDetector.get_supported_platforms_str()
+                domain = RepositoryDetector.get_domain_from_task_data(task_data) or "unknown"
+                logger.error("Repository domain '%s' does not match any supported platform (%s). No tools available for %s", domain, supported, member_label)
+            else:
+                logger.info("Repository domain not matched, loaded all available tools for %s", member_label)
+        
+        return all_tools, default_headers
     
-    async def create_member(self, member_config: Dict[str, Any], task_data: Dict[str, Any]) -> Optional[AgnoSdkAgent]:
+    async def create_member(self, member_config: Dict[str, Any], task_data: Dict[str, Any], tool_type: Any = _DETECT_TOOL_TYPE) -> Optional[AgnoSdkAgent]:
         """
         Create a single team member with comprehensive configuration
         
         Args:
             member_config: Member configuration dictionary
             task_data: Task data for member creation
+            tool_type: Pre-detected tool type (may be None); detected from task_data if omitted
             
         Returns:
             Team member instance or None if creation fails
         """
         try:
-            logger.info(f"Creating team member: {member_config.get('name', 'Unnamed')}")
-            
-            # Setup MCP tools if available
-            mcp_tools = await self.mcp_manager.setup_mcp_tools(member_config)
-            agent_config = member_config.get("agent_config", {})
-
-            # Prepare data sources for placeholder replacement
-            data_sources = {
-                "agent_config": agent_config,
-                "options": member_config,
-                "executor_env": self.config_manager.executor_env,
-                "task_data": task_data
-            }
-            
-            # Build default headers with placeholders
-            default_headers = self.config_manager.build_default_headers_with_placeholders(data_sources)
+            logger.info("Creating team member: %s", member_config.get("name", "Unnamed"))
             
             # Get member-specific configuration
-            member_name = self._get_member_name(member_config)
-            member_description = self._get_member_description(member_config)
-            member_model = ModelFactory.create_model(agent_config, default_headers)
-            
-            # Detect and load appropriate tools based on repository domain
-            all_tools = []
-            tool_type = RepositoryDetector.detect_tool_type(task_data)
+            member_name = member_config.get("name", "TeamMember")
+            member_description = member_config.get("system_prompt", "Team member")
             
-            if tool_type == "github_mcp":
-                # Load GitHub MCP tools
-                if mcp_tools:
-                    all_tools.extend(mcp_tools)
-                    logger.info(f"Matched GitHub repository, loaded {len(mcp_tools)} GitHub MCP tools for member {member_name}")
-                else:
-                    logger.warning(f"Matched GitHub repository but no GitHub MCP tools available for member {member_name}")
-            elif tool_type == "gitlab_sdk":
-                # Load GitLab SDK tools
-                gitlab_tool_manager = GitLabToolManager(task_data)
-                gitlab_tools = gitlab_tool_manager.create_tools()
-                if gitlab_tools:
-                    all_tools.extend(gitlab_tools)
-                    logger.info(f"Matched GitLab repository, loaded {len(gitlab_tools)} GitLab SDK tools for member {member_name}")
-                else:
-                    logger.warning(f"Matched GitLab repository but GitLab tools are not available for member {member_name}")
-            else:
-                # No match: try all tools, if none work, log error
-                loaded_any = False
-                if mcp_tools:
-                    all_tools.extend(mcp_tools)
-                    loaded_any = True
-                gitlab_tool_manager = GitLabToolManager(task_data)
-                gitlab_tools = gitlab_tool_manager.create_tools()
-                if gitlab_tools:
-                    all_tools.extend(gitlab_tools)
-                    loaded_any = True
-                
-                if not loaded_any:
-                    supported = ", ".join(RepositoryDetector.get_supported_platforms())
-                    domain = RepositoryDetector.get_domain_from_task_data(task_data) or "unknown"
-                    logger.error(f"Repository domain '{domain}' does not match any supported platform ({supported}). No tools available for member {member_name}")
-                else:
-                    logger.info(f"Repository domain not matched, loaded all available tools for member {member_name}")
+            all_tools, default_headers = await self._assemble_tools(
+                member_config, task_data, f"member {member_name}", tool_type
+            )
+            member_model = ModelFactory.create_model(member_config.get("agent_config", {}), default_headers)
             
             # Create the team member
             member = AgnoSdkAgent(
                 name=member_name,
                 model=member_model,
                 role=member_description,
-                add_name_to_context=True,
-                add_datetime_to_context=True,
                 tools=all_tools,
                 description=member_description,
                 db=self.db,
-                add_history_to_context=True,
-                num_history_runs=3,
-                telemetry=False
+                **_AGENT_DEFAULTS
             )
             
-            logger.info(f"Successfully created team member: {member_name}")
+            logger.info("Successfully created team member: %s", member_name)
             return member
             
         except Exception as e:
-            logger.error(f"Failed to create team member: {str(e)}")
+            logger.error("Failed to create team member: %s", e)
             return None
     
     async def create_default_member(self, options: Dict[str, Any], task_data: Dict[str, Any]) -> Optional[AgnoSdkAgent]:
@@ -147,81 +195,56 @@ class MemberBuilder:
         try:
             logger.info("Creating default team member")
             
-            # Setup MCP tools if available
-            mcp_tools = await self.mcp_manager.setup_mcp_tools(options)
-            agent_config = options.get("agent_config", {})
-            
-            # Prepare data sources for placeholder replacement
-            data_sources = {
-                "agent_config": agent_config,
-                "options": options,
-                "executor_env": self.config_manager.executor_env,
-                "task_data": task_data
-            }
-            
-            # Build default headers with placeholders
-            default_headers = self.config_manager.build_default_headers_with_placeholders(data_sources)
-            
-            # Detect and load appropriate tools based on repository domain
-            all_tools = []
-            tool_type = RepositoryDetector.detect_tool_type(task_data)
-            
-            if tool_type == "github_mcp":
-                # Load GitHub MCP tools
-                if mcp_tools:
-                    all_tools.extend(mcp_tools)
-                    logger.info(f"Matched GitHub repository, loaded {len(mcp_tools)} GitHub MCP tools for default member")
-                else:
-                    logger.warning(f"Matched GitHub repository but no GitHub MCP tools available for default member")
-            elif tool_type == "gitlab_sdk":
-                # Load GitLab SDK tools
-                gitlab_tool_manager = GitLabToolManager(task_data)
-                gitlab_tools = gitlab_tool_manager.create_tools()
-                if gitlab_tools:
-                    all_tools.extend(gitlab_tools)
-                    logger.info(f"Matched GitLab repository, loaded {len(gitlab_tools)} GitLab SDK tools for default member")
-                else:
-                    logger.warning(f"Matched GitLab repository but GitLab tools are not available for default member")
-            else:
-                # No match: try all tools, if none work, log error
-                loaded_any = False
-                if mcp_tools:
-                    all_tools.extend(mcp_tools)
-                    loaded_any = True
-                gitlab_tool_manager = GitLabToolManager(task_data)
-                gitlab_tools = gitlab_tool_manager.create_tools()
-                if gitlab_tools:
-                    all_tools.extend(gitlab_tools)
-                    loaded_any = True
-                
-                if not loaded_any:
-                    supported = ", ".join(RepositoryDetector.get_supported_platforms())
-                    domain = RepositoryDetector.get_domain_from_task_data(task_data) or "unknown"
-                    logger.error(f"Repository domain '{domain}' does not match any supported platform ({supported}). No tools available for default member")
-                else:
-                    logger.info(f"Repository domain not matched, loaded all available tools for default member")
+            all_tools, default_headers = await self._assemble_tools(options, task_data, "default member")
             
             # Create the default member
             member = AgnoSdkAgent(
                 name="DefaultAgent",
-                model=ModelFactory.create_model(agent_config, default_headers),
+                model=ModelFactory.create_model(options.get("agent_config", {}), default_headers),
                 tools=all_tools,
                 description="Default team member",
-                add_name_to_context=True,
-                add_datetime_to_context=True,
                 db=self.db,
-                add_history_to_context=True,
-                num_history_runs=3,
-                telemetry=False
+                **_AGENT_DEFAULTS
             )
             
             logger.info("Successfully created default team member")
             return member
             
         except Exception as e:
-            logger.error(f"Failed to create default team member: {str(e)}")
+            logger.error("Failed to create default team member: %s", e)
             return None
     
+    async def create_members(self, team_members_config: List[Dict[str, Any]], task_data: Dict[str, Any]) -> List[Optional[AgnoSdkAgent]]:
+        """
+        Create team members concurrently, keeping results aligned with their configs
+        
+        Args:
+            team_members_config: List of member configurations
+            task_data: Task data for member creation
+            
+        Returns:
+            One entry per config: the created member, or None if creation failed
+        """
+        if not team_members_config:
+            return []
+        
+        # The repository is shared by every member, so detect its tool type once
+        tool_type = RepositoryDetector.detect_tool_type(task_data)
+        # Members are independent, so their MCP setup runs concurrently
+        results = await asyncio.gather(
+            *(self.create_member(member_config, task_data, tool_type=tool_type) for member_config in team_members_config),
+            return_exceptions=True
+        )
+        members = []
+        for member_config, result in zip(team_members_config, results):
+            if isinstance(result, BaseException):
+                logger.error("Failed to create member from config: %s, error: %s", member_config, result)
+                result = None
+            elif not result:
+                logger.warning("Failed to create member from config: %s", member_config)
+            members.append(result)
+        return members
+    
     async def create_members_from_config(self, team_members_config: List[Dict[str, Any]], task_data: Dict[str, Any]) -> List[AgnoSdkAgent]:
         """
         Create multiple team members from configuration list
@@ -233,20 +256,13 @@ class MemberBuilder:
         Returns:
             List of created team members
         """
-        members = []
-        
         if not team_members_config:
             logger.warning("No team members configuration provided")
-            return members
+            return []
         
-        for member_config in team_members_config:
-            member = await self.create_member(member_config, task_data)
-            if member:
-                members.append(member)
-            else:
-                logger.warning(f"Failed to create member from config: {member_config}")
+        members = [member for member in await self.create_members(team_members_config, task_data) if member]
         
-        logger.info(f"Created {len(members)} team members from configuration")
+        logger.info("Created %d team members from configuration", len(members))
         return members
     
     async def create_member_with_role(self, member_config: Dict[str, Any], task_data: Dict[str, Any], role: str) -> Optional[AgnoSdkAgent]:
@@ -262,46 +278,21 @@ class MemberBuilder:
             Team member instance or None if creation fails
         """
         try:
-            # Add role to member configuration
-            member_config_with_role = member_config.copy()
-            member_config_with_role["role"] = role
+            # Layer the role over the member configuration without copying it
+            member_config_with_role = ChainMap({"role": role}, member_config)
             
             # Create the member
             member = await self.create_member(member_config_with_role, task_data)
             
             if member:
-                logger.info(f"Created team member with role '{role}': {member.name}")
+                logger.info("Created team member with role '%s': %s", role, member.name)
             
             return member
             
         except Exception as e:
-            logger.error(f"Failed to create team member with role '{role}': {str(e)}")
+            logger.error("Failed to create team member with role '%s': %s", role, e)
             return None
     
-    def _get_member_name(self, member_config: Dict[str, Any]) -> str:
-        """
-        Get the member name from configuration, with fallback
-        
-        Args:
-            member_config: Member configuration dictionary
-            
-        Returns:
-            Member name string
-        """
-        return member_config.get("name", "TeamMember")
-    
-    def _get_member_description(self, member_config: Dict[str, Any]) -> str:
-        """
-        Get the member description from configuration, with fallback
-        
-        Args:
-            member_config: Member configuration dictionary
-            
-        Returns:
-            Member description string
-        """
-        return member_config.get("system_prompt", "Team member")
-    
     def _validate_member_config(self, member_config: Dict[str, Any]) -> bool:
         """
         Validate member configuration
@@ -330,15 +321,15 @@ class MemberBuilder:
             member: Team member instance to clean up
         """
         try:
-            logger.info(f"Cleaning up resources for member: {member.name}")
+            logger.info("Cleaning up resources for member: %s", member.name)
             
             # Clean up MCP tools if any
             await self.mcp_manager.cleanup_tools()
             
-            logger.info(f"Successfully cleaned up resources for member: {member.name}")
+            logger.info("Successfully cleaned up resources for member: %s", member.name)
             
         except Exception as e:
-            logger.error(f"Failed to clean up resources for member {member.name}: {str(e)}")
+            logger.error("Failed to clean up resources for member %s: %s", member.name, e)
     
     async def cleanup_all_resources(self) -> None:
         """
@@ -353,4 +344,4 @@ class MemberBuilder:
             logger.info("Successfully cleaned up all member builder resources")
             
         except Exception as e:
-            logger.error(f"Failed to clean up member builder resources: {str(e)}")
\ No newline at end of file
+            logger.error("Failed to clean up member builder resources: %s", e)
\ No newline at end of file
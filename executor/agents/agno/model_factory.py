@@ -6,6 +6,7 @@
 
 # -*- coding: utf-8 -*-
 
+import json
 import os
 from typing import Dict, Any, Union
 from agno.models.openai import OpenAIChat
@@ -13,21 +14,55 @@ from agno.models.anthropic import Claude
 from agno.models.google import Gemini
 from google.genai import Client
 from google.genai.types import HttpOptions
+from executor.config import config
 from shared.logger import setup_logger
 
 logger = setup_logger("agno_model_factory")
 
+MODEL_CACHE_MAX_ENTRIES = 64
+
 
 class ModelFactory:
     """
     Factory class for creating AI model instances
     """
     
+    # Model instances keyed by canonical (agent_config, default_headers) JSON
+    _MODEL_CACHE: Dict[str, Union[Claude, OpenAIChat, Gemini]] = {}
+    
     @staticmethod
     def create_model(agent_config: Dict[str, Any], default_headers: Dict[str, Any]) -> Union[Claude, OpenAIChat, Gemini]:
         """
         Create a model instance based on configuration
 
+        When WEGENT_MODEL_CACHE=1 (see executor.config.config.MODEL_CACHE_ENABLED),
+        identical agent_config and default_headers share one model instance.
+
+        Args:
+            agent_config: Agent configuration dictionary
+            default_headers: Default headers for API requests
+
+        Returns:
+            Model instance (Claude, OpenAI or Gemini)
+        """
+        if not config.MODEL_CACHE_ENABLED:
+            return ModelFactory._build_model(agent_config, default_headers)
+        
+        cache_key = json.dumps([agent_config, default_headers], sort_keys=True, default=str)
+        model = ModelFactory._MODEL_CACHE.get(cache_key)
+        if model is None:
+            model = ModelFactory._build_model(agent_config, default_headers)
+            if len(ModelFactory._MODEL_CACHE) >= MODEL_CACHE_MAX_ENTRIES:
+                # Evict the oldest entry
+                del ModelFactory._MODEL_CACHE[next(iter(ModelFactory._MODEL_CACHE))]
+            ModelFactory._MODEL_CACHE[cache_key] = model
+        return model
+    
+    @staticmethod
+    def _build_model(agent_config: Dict[str, Any], default_headers: Dict[str, Any]) -> Union[Claude, OpenAIChat, Gemini]:
+        """
+        Build a new model instance based on configuration
+
         Args:
             agent_config: Agent configuration dictionary
             default_headers: Default headers for API requests
@@ -6,23 +6,101 @@
 
 # -*- coding: utf-8 -*-
 
-from typing import Dict, Any, List, Optional
+import functools
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
 from shared.logger import setup_logger
 
 logger = setup_logger("repository_detector")
 
+# Platform keyword to tool type mapping, exposed read-only as RepositoryDetector.PLATFORM_TOOLS
+_PLATFORM_TOOLS_RAW = {
+    "github": "github_mcp",
+    "gitlab": "gitlab_sdk"
+    # ... add more platforms here
+}
+
+
+def _extract_host(value: str) -> str:
+    """
+    Extract the lowercased host from a domain or URL string
+    
+    Only the host is needed, so split by hand instead of urlparse. This handles
+    scheme-prefixed domains, ports, paths and SSH-style "git@host:group/repo" URLs.
+    
+    Args:
+        value: Domain ("gitlab.com", "http://gitlab.local:8080") or git URL
+        
+    Returns:
+        Host string, empty if none could be extracted
+    """
+    scheme_end = value.find("://")
+    rest = value[scheme_end + 3:] if scheme_end >= 0 else value
+    for separator in ("/", "?"):
+        rest = rest.split(separator, 1)[0]
+    # Drop "user@" / "user:password@" and then a port or SSH path separator
+    return rest.rpartition("@")[2].split(":", 1)[0].lower()
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_domain(git_domain: str, git_url: str) -> Optional[str]:
+    """
+    Extract the lowercased domain from git_domain or git_url, memoized per pair
+    
+    Args:
+        git_domain: git_domain field of task_data
+        git_url: git_url field of task_data
+        
+    Returns:
+        Domain string or None
+    """
+    # Try git_domain first, then parse the host from git_url
+    for value in (git_domain, git_url):
+        if value:
+            domain = _extract_host(value)
+            if domain:
+                return domain
+    
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _detect_tool_type_cached(git_domain: str, git_url: str) -> Optional[str]:
+    """
+    Detect the tool type for a git_domain/git_url pair, memoized per pair
+    
+    Args:
+        git_domain: git_domain field of task_data
+        git_url: git_url field of task_data
+        
+    Returns:
+        Tool type: "github_mcp", "gitlab_sdk", or None if no match
+    """
+    domain = _extract_domain(git_domain, git_url)
+    if not domain:
+        return None
+    
+    # Match platform keywords within the host labels only, so "mygitlab.corp.com"
+    # matches while scheme, port and path never take part in the match
+    labels = domain.split(".")
+    for keyword, tool_type in RepositoryDetector.PLATFORM_TOOLS.items():
+        if any(keyword in label for label in labels):
+            return tool_type
+    
+    return None
+
 
 class RepositoryDetector:
     """
     Detects repository type and determines which tools to load based on domain matching
     """
     
-    # Platform keyword to tool type mapping
-    PLATFORM_TOOLS = {
-        "github": "github_mcp",
-        "gitlab": "gitlab_sdk"
-        # ... add more platforms here
-    }
+    # Read-only platform keyword to tool type mapping; memoized detection relies on it never changing
+    PLATFORM_TOOLS = MappingProxyType(_PLATFORM_TOOLS_RAW)
+    
+    # Supported platform keywords and their display string, computed once
+    _SUPPORTED_PLATFORMS = tuple(_PLATFORM_TOOLS_RAW)
+    _SUPPORTED_PLATFORMS_STR = ", ".join(_SUPPORTED_PLATFORMS)
     
     @classmethod
     def get_domain_from_task_data(cls, task_data: Dict[str, Any]) -> Optional[str]:
@@ -35,55 +113,53 @@ class RepositoryDetector:
         Returns:
             Domain string or None
         """
-        # Try git_domain first
-        git_domain = task_data.get("git_domain", "")
-        if git_domain:
-            return git_domain.lower()
-        
-        # Try parsing from git_url
-        git_url = task_data.get("git_url", "")
-        if git_url:
-            try:
-                from urllib.parse import urlparse
-                parsed = urlparse(git_url)
-                domain = parsed.netloc or (parsed.path.split('/')[0] if parsed.path else "")
-                if domain:
-                    return domain.lower()
-            except Exception:
-                pass
-        
-        return None
+        return _extract_domain(task_data.get("git_domain") or "", task_data.get("git_url") or "")
     
     @classmethod
     def detect_tool_type(cls, task_data: Dict[str, Any]) -> Optional[str]:
         """
         Detect which tool type to use based on domain matching
         
+        Results are memoized per (git_domain, git_url), so repeated calls for the
+        same task only parse and match the domain once.
+        
         Args:
             task_data: Task data dictionary
             
         Returns:
             Tool type: "github_mcp", "gitlab_sdk", or None if no match
         """
-        domain = cls.get_domain_from_task_data(task_data)
-        if not domain:
+        git_domain = task_data.get("git_domain")
+        git_url = task_data.get("git_url")
+        # Tasks without any git fields never match a platform
+        if not (git_domain or git_url):
             return None
         
-        # Match domain against platform keywords
-        for keyword, tool_type in cls.PLATFORM_TOOLS.items():
-            if keyword in domain:
-                logger.info(f"Matched domain '{domain}' to {tool_type} using keyword '{keyword}'")
-                return tool_type
+        git_domain = git_domain or ""
+        git_url = git_url or ""
+        tool_type = _detect_tool_type_cached(git_domain, git_url)
+        # Logged here rather than in the memoized function so every task reports its match
+        if tool_type:
+            logger.info("Matched domain '%s' to %s", _extract_domain(git_domain, git_url), tool_type)
+        return tool_type
+    
+    @classmethod
+    def get_supported_platforms(cls) -> Tuple[str, ...]:
+        """
+        Get supported platform keywords
         
-        return None
+        Returns:
+            Tuple of platform keywords
+        """
+        return cls._SUPPORTED_PLATFORMS
     
     @classmethod
-    def get_supported_platforms(cls) -> List[str]:
+    def get_supported_platforms_str(cls) -> str:
         """
-        Get list of supported platform keywords
+        Get supported platform keywords as a comma-separated string
         
         Returns:
-            List of platform keywords
+            Platform keywords joined with ", "
         """
-        return list(cls.PLATFORM_TOOLS.keys())
+        return cls._SUPPORTED_PLATFORMS_STR
 
@@ -121,9 +121,9 @@ class TeamBuilder:
         
         if team_members_config:
             if isinstance(team_members_config, list):
-                # Multiple team members
-                for member_config in team_members_config:
-                    member = await self.member_builder.create_member(member_config, task_data)
+                # Multiple team members, created concurrently with MCP setup capped
+                created_members = await self.member_builder.create_members(team_members_config, task_data)
+                for member_config, member in zip(team_members_config, created_members):
                     if member:
                         # Check if this member is a team leader
                         if member_config.get("role") == "leader":
@@ -18,6 +18,16 @@ CALLBACK_URL = os.environ.get("CALLBACK_URL", "")
 EXECUTOR_ENV = os.environ.get("EXECUTOR_ENV", "{}")
 DEBUG_RUN = os.environ.get("DEBUG_RUN", "")
 
+# Agno model instance reuse (opt-in, "1" to enable)
+# When enabled, ModelFactory returns one shared model instance per identical
+# (agent_config, default_headers) pair for the lifetime of the executor process,
+# across members and tasks. Credentials, base URL and rendered headers are part of
+# the cache key, so sharing is only unsafe if a model keeps per-run state or relies
+# on process-wide side effects: the Claude path sets ANTHROPIC_BASE_URL only when
+# a model is built, not on a cache hit. Enable it for executors that run a single
+# task per process, or where models with the same config are known to be stateless.
+MODEL_CACHE_ENABLED = os.environ.get("WEGENT_MODEL_CACHE", "") == "1"
+
 # Task cancellation configuration
 CANCEL_TIMEOUT_SECONDS = int(os.environ.get("CANCEL_TIMEOUT_SECONDS", "30"))
 CANCEL_RETRY_ATTEMPTS = int(os.environ.get("CANCEL_RETRY_ATTEMPTS", "3"))
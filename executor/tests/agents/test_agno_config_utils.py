@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import pytest
+from executor.agents.agno.config_utils import (
+    ConfigManager,
+    parse_placeholder_template,
+    render_placeholder_template,
+    replace_placeholders_with_sources,
+    resolve_value_from_source,
+)
+
+
+def _legacy_replace(template, data_sources):
+    """Previous re.sub based implementation, kept as the reference behaviour"""
+    return re.sub(
+        r'\$\{([^}]+)\}',
+        lambda match: resolve_value_from_source(data_sources, match.group(1)),
+        template,
+    )
+
+
+DATA_SOURCES = {
+    "agent_config": {"env": {"user": "alice", "port": 8080, "empty": None}},
+    "task_data": {"user": {"name": "bob"}, "items": ["zero", "one"]},
+}
+
+
+@pytest.mark.unit
+class TestPlaceholderTemplate:
+    """Test cases for pre-parsed placeholder templates"""
+
+    def test_parse_splits_literals_and_specs(self):
+        """Test templates split into (literal, spec) parts with a trailing literal"""
+        assert parse_placeholder_template("Bearer ${env.user}!") == (
+            ("Bearer ", "env.user"),
+            ("!", None),
+        )
+        assert parse_placeholder_template("plain") == (("plain", None),)
+        assert parse_placeholder_template("") == (("", None),)
+
+    def test_parse_is_memoized(self):
+        """Test the same template string returns the cached parse"""
+        template = "${task_data.user.name}-${env.user}"
+        assert parse_placeholder_template(template) is parse_placeholder_template(template)
+
+    @pytest.mark.parametrize("template", [
+        "",
+        "no placeholders",
+        "${env.user}",
+        "user=${env.user}; port=${agent_config.env.port}",
+        "${task_data.user.name}${task_data.items.1}${task_data.items.5}",
+        "${missing.path} and ${env.empty}",
+        "${env.user",
+        "$${env.user}}",
+        "${}${env.user}",
+        "a ${ b } c",
+    ])
+    def test_render_matches_legacy_re_sub(self, template):
+        """Test rendering produces exactly what the previous re.sub implementation did"""
+        expected = _legacy_replace(template, DATA_SOURCES)
+        assert render_placeholder_template(parse_placeholder_template(template), DATA_SOURCES) == expected
+        assert replace_placeholders_with_sources(template, DATA_SOURCES) == expected
+
+    def test_render_resolves_against_current_sources(self):
+        """Test a cached parse is rendered against whichever data sources are passed"""
+        parts = parse_placeholder_template("${agent_config.env.user}")
+        assert render_placeholder_template(parts, DATA_SOURCES) == "alice"
+        assert render_placeholder_template(parts, {"agent_config": {"env": {"user": "carol"}}}) == "carol"
+
+
+@pytest.mark.unit
+class TestConfigManagerHeaders:
+    """Test cases for default header placeholder expansion"""
+
+    def test_build_default_headers_with_placeholders(self):
+        """Test string headers are expanded and other values are passed through"""
+        manager = ConfigManager({"DEFAULT_HEADERS": {"X-User": "${agent_config.env.user}", "X-Retries": 3}})
+
+        assert manager.build_default_headers_with_placeholders(DATA_SOURCES) == {
+            "X-User": "alice",
+            "X-Retries": 3,
+        }
+
+    def test_header_templates_follow_replaced_headers(self):
+        """Test replacing default_headers invalidates the parsed header templates"""
+        manager = ConfigManager({"DEFAULT_HEADERS": {"X-User": "${agent_config.env.user}"}})
+        manager.build_default_headers_with_placeholders(DATA_SOURCES)
+
+        manager.default_headers = {"X-Name": "${task_data.user.name}"}
+        assert manager.build_default_headers_with_placeholders(DATA_SOURCES) == {"X-Name": "bob"}
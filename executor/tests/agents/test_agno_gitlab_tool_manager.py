@@ -0,0 +1,374 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import pytest
+from unittest.mock import MagicMock, patch
+import gitlab
+import requests
+from executor.agents.agno import gitlab_tool_manager
+from executor.agents.agno.gitlab_tool_manager import (
+    GitLabToolManager,
+    _decrypt_token,
+    _get_authenticated_client,
+    _get_gitlab_token_map,
+    _read_token_file,
+    _token_file_for,
+    clear_client_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Reset module level client and token caches around every test"""
+    clear_client_cache()
+    gitlab_tool_manager._USER_TOKEN_MAP.clear()
+    yield
+    clear_client_cache()
+    gitlab_tool_manager._USER_TOKEN_MAP.clear()
+
+
+@pytest.mark.unit
+class TestAuthenticatedClientCache:
+    """Test cases for the shared authenticated client cache"""
+
+    @pytest.fixture
+    def mock_gitlab(self):
+        """Mock gitlab.Gitlab so no authentication request is sent"""
+        with patch.object(gitlab_tool_manager.gitlab, "Gitlab") as mock_cls:
+            mock_cls.side_effect = lambda *args, **kwargs: MagicMock()
+            yield mock_cls
+
+    @pytest.fixture
+    def clock(self):
+        """Controllable time.monotonic"""
+        now = [1000.0]
+        with patch.object(gitlab_tool_manager.time, "monotonic", side_effect=lambda: now[0]):
+            yield now
+
+    def test_reuses_client_within_ttl(self, mock_gitlab, clock):
+        """Test the same domain and token share one client until the TTL expires"""
+        first = _get_authenticated_client("gitlab.com", "https://gitlab.com", "token")
+        clock[0] += gitlab_tool_manager.CLIENT_CACHE_TTL_SECONDS - 1
+        second = _get_authenticated_client("gitlab.com", "https://gitlab.com", "token")
+
+        assert second is first
+        assert mock_gitlab.call_count == 1
+        first.auth.assert_called_once()
+
+    def test_reauthenticates_after_ttl(self, mock_gitlab, clock):
+        """Test an expired client is replaced by a freshly authenticated one"""
+        first = _get_authenticated_client("gitlab.com", "https://gitlab.com", "token")
+        clock[0] += gitlab_tool_manager.CLIENT_CACHE_TTL_SECONDS
+        second = _get_authenticated_client("gitlab.com", "https://gitlab.com", "token")
+
+        assert second is not first
+        assert mock_gitlab.call_count == 2
+        assert len(gitlab_tool_manager._CLIENT_CACHE) == 1
+
+    def test_clients_are_keyed_by_domain_and_token(self, mock_gitlab, clock):
+        """Test different tokens or domains never share a client"""
+        first = _get_authenticated_client("gitlab.com", "https://gitlab.com", "token-a")
+        other_token = _get_authenticated_client("gitlab.com", "https://gitlab.com", "token-b")
+        other_domain = _get_authenticated_client("gitlab.corp.com", "https://gitlab.corp.com", "token-a")
+
+        assert len({id(first), id(other_token), id(other_domain)}) == 3
+        # Raw tokens are never used as cache keys
+        assert all("token-a" not in key[1] for key in gitlab_tool_manager._CLIENT_CACHE)
+
+    def test_rejected_token_is_negatively_cached(self, mock_gitlab, clock):
+        """Test a rejected token skips authentication until the failure TTL expires"""
+        rejected = MagicMock()
+        rejected.auth.side_effect = gitlab.exceptions.GitlabAuthenticationError("401 Unauthorized")
+        mock_gitlab.side_effect = None
+        mock_gitlab.return_value = rejected
+
+        with pytest.raises(gitlab.exceptions.GitlabAuthenticationError):
+            _get_authenticated_client("gitlab.com", "https://gitlab.com", "bad")
+
+        clock[0] += gitlab_tool_manager.AUTH_FAIL_CACHE_TTL_SECONDS - 1
+        assert _get_authenticated_client("gitlab.com", "https://gitlab.com", "bad") is None
+        assert mock_gitlab.call_count == 1
+
+        clock[0] += 1
+        with pytest.raises(gitlab.exceptions.GitlabAuthenticationError):
+            _get_authenticated_client("gitlab.com", "https://gitlab.com", "bad")
+        assert mock_gitlab.call_count == 2
+
+    def test_other_errors_are_not_negatively_cached(self, mock_gitlab, clock):
+        """Test transient failures are retried on the next call"""
+        failing = MagicMock()
+        failing.auth.side_effect = gitlab.exceptions.GitlabHttpError("502 Bad Gateway")
+        mock_gitlab.side_effect = None
+        mock_gitlab.return_value = failing
+
+        for _ in range(2):
+            with pytest.raises(gitlab.exceptions.GitlabHttpError):
+                _get_authenticated_client("gitlab.com", "https://gitlab.com", "token")
+        assert mock_gitlab.call_count == 2
+        assert not gitlab_tool_manager._AUTH_FAIL_CACHE
+
+    def test_success_clears_negative_cache(self, mock_gitlab, clock):
+        """Test a token accepted after the failure TTL is no longer marked as rejected"""
+        rejected = MagicMock()
+        rejected.auth.side_effect = gitlab.exceptions.GitlabAuthenticationError("401 Unauthorized")
+        mock_gitlab.side_effect = [rejected, MagicMock()]
+
+        with pytest.raises(gitlab.exceptions.GitlabAuthenticationError):
+            _get_authenticated_client("gitlab.com", "https://gitlab.com", "token")
+        clock[0] += gitlab_tool_manager.AUTH_FAIL_CACHE_TTL_SECONDS
+
+        assert _get_authenticated_client("gitlab.com", "https://gitlab.com", "token") is not None
+        assert not gitlab_tool_manager._AUTH_FAIL_CACHE
+
+    def test_clients_share_pools_but_not_cookies(self, mock_gitlab, clock):
+        """Test every client gets its own session and cookie jar on the shared adapter"""
+        _get_authenticated_client("gitlab.com", "https://gitlab.com", "token-a")
+        _get_authenticated_client("gitlab.com", "https://gitlab.com", "token-b")
+        first, second = (call.kwargs["session"] for call in mock_gitlab.call_args_list)
+
+        assert first is not second
+        assert first.get_adapter("https://gitlab.com") is second.get_adapter("https://gitlab.com")
+        first.cookies.set("_gitlab_session", "user-a", domain="gitlab.com")
+        assert not second.cookies
+
+
+@pytest.mark.unit
+class TestTokenLookup:
+    """Test cases for token decryption, token map and token file caches"""
+
+    def test_token_map_keeps_first_gitlab_entry_per_domain(self):
+        """Test only GitLab entries are mapped and the first entry per domain wins"""
+        user_config = {
+            "git_info": [
+                {"type": "github", "git_domain": "github.com", "git_token": "gh"},
+                {"type": "GitLab", "git_domain": "gitlab.com", "git_token": "first"},
+                {"type": "gitlab", "git_domain": "gitlab.com", "git_token": "second"},
+                {"type": "gitlab", "git_domain": "gitlab.corp.com", "git_token": "corp"},
+            ]
+        }
+
+        assert _get_gitlab_token_map(user_config) == {"gitlab.com": "first", "gitlab.corp.com": "corp"}
+
+    def test_token_map_tolerates_malformed_entries(self):
+        """Test non-dict items and None fields are skipped instead of raising"""
+        user_config = {
+            "git_info": [
+                "gitlab.com",
+                None,
+                {"type": None, "git_domain": "gitlab.com", "git_token": "x"},
+                {"type": "gitlab", "git_domain": "gitlab.com", "git_token": None},
+            ]
+        }
+
+        assert _get_gitlab_token_map(user_config) == {"gitlab.com": ""}
+        assert _get_gitlab_token_map({"git_info": None}) == {}
+
+    def test_token_map_is_built_once_per_config(self):
+        """Test the same config object reuses its map while a new config gets its own"""
+        user_config = {"git_info": [{"type": "gitlab", "git_domain": "gitlab.com", "git_token": "a"}]}
+        first = _get_gitlab_token_map(user_config)
+
+        assert _get_gitlab_token_map(user_config) is first
+
+        other_config = {"git_info": [{"type": "gitlab", "git_domain": "gitlab.com", "git_token": "b"}]}
+        assert _get_gitlab_token_map(other_config) == {"gitlab.com": "b"}
+
+    def test_decrypt_token_is_memoized(self):
+        """Test each raw token is decrypted once"""
+        _decrypt_token.cache_clear()
+        with patch.object(gitlab_tool_manager, "is_token_encrypted", return_value=True), \
+             patch.object(gitlab_tool_manager, "decrypt_git_token", return_value="plain") as decrypt:
+            assert _decrypt_token("encrypted") == "plain"
+            assert _decrypt_token("encrypted") == "plain"
+
+        decrypt.assert_called_once_with("encrypted")
+        _decrypt_token.cache_clear()
+
+    def test_token_file_path_is_memoized_until_cleared(self, tmp_path, monkeypatch):
+        """Test the token file lookup is cached per domain until clear_client_cache"""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        token_path = tmp_path / ".ssh" / "gitlab.com"
+
+        assert _token_file_for("gitlab.com") is None
+
+        token_path.parent.mkdir()
+        token_path.write_text("token")
+        assert _token_file_for("gitlab.com") is None
+
+        clear_client_cache()
+        assert _token_file_for("gitlab.com") == str(token_path)
+
+    def test_read_token_file_reloads_when_mtime_changes(self, tmp_path):
+        """Test the cached token is reused until the file's mtime changes"""
+        token_path = tmp_path / "gitlab.com"
+        token_path.write_text("old-token\n")
+        os.utime(token_path, (1000, 1000))
+
+        assert _read_token_file(str(token_path)) == "old-token"
+
+        # Same mtime: the cached content is returned without reading the file
+        token_path.write_text("new-token\n")
+        os.utime(token_path, (1000, 1000))
+        assert _read_token_file(str(token_path)) == "old-token"
+
+        os.utime(token_path, (2000, 2000))
+        assert _read_token_file(str(token_path)) == "new-token"
+
+
+@pytest.mark.unit
+class TestFilesInfo:
+    """Test cases for the GraphQL file info lookup and its REST fallback"""
+
+    @pytest.fixture
+    def manager(self):
+        """Manager with a mocked client and a known project path"""
+        manager = GitLabToolManager({"git_repo_id": 1, "git_repo": "group/repo", "branch_name": "main"})
+        manager.gitlab_client = MagicMock()
+        return manager
+
+    def test_uses_graphql_result(self, manager):
+        """Test all files are described from one GraphQL response"""
+        commit = {"sha": "abc", "authorName": "alice", "committedDate": "2025-01-01", "message": "init"}
+        with patch.object(manager, "_graphql_last_commits", return_value=[commit, None]), \
+             patch.object(manager, "_run_bulk") as run_bulk:
+            result = manager.get_gitlab_files_info(["a.py", "b.py"])
+
+        assert "=== a.py ===" in result and "abc" in result
+        assert "No commit history found for b.py" in result
+        run_bulk.assert_not_called()
+
+    @pytest.mark.parametrize("error", [
+        gitlab.exceptions.GitlabError("GraphQL last commit query failed"),
+        requests.ConnectionError("connection reset"),
+        KeyError("sha"),
+    ])
+    def test_falls_back_to_rest_on_request_errors(self, manager, error):
+        """Test GitLab, transport and response-shape errors fall back to per-file REST calls"""
+        with patch.object(manager, "_graphql_last_commits", side_effect=error), \
+             patch.object(manager, "_run_bulk", return_value="rest") as run_bulk:
+            assert manager.get_gitlab_files_info(["a.py"], "dev") == "rest"
+
+        run_bulk.assert_called_once_with(manager.get_gitlab_file_info, ["a.py"], "dev")
+
+    def test_programming_errors_propagate(self, manager):
+        """Test unexpected errors are not hidden behind the REST fallback"""
+        with patch.object(manager, "_graphql_last_commits", side_effect=TypeError("bad call")), \
+             patch.object(manager, "_run_bulk") as run_bulk:
+            with pytest.raises(TypeError):
+                manager.get_gitlab_files_info(["a.py"])
+
+        run_bulk.assert_not_called()
+
+
+@pytest.mark.unit
+class TestIsAvailable:
+    """Test cases for the GitLabToolManager.is_available pre-check"""
+
+    @pytest.fixture(autouse=True)
+    def no_token_files(self, tmp_path, monkeypatch):
+        """Point ~ at an empty directory so no token file is found"""
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+    @pytest.mark.parametrize("task_data, expected", [
+        ({"git_domain": "gitlab.com", "user": {"git_domain": "gitlab.com", "git_token": "t"}}, True),
+        ({"git_domain": "gitlab.com", "user": {"git_info": [
+            {"type": "gitlab", "git_domain": "gitlab.com", "git_token": "t"}
+        ]}}, True),
+        ({"git_domain": "gitlab.com", "user": {"git_domain": "gitlab.com", "git_token": ""}}, False),
+        ({"git_domain": "gitlab.com"}, False),
+        ({"user": {"git_domain": "gitlab.com", "git_token": "t"}}, False),
+    ])
+    def test_token_sources(self, task_data, expected):
+        """Test a token from the user config or its git_info list makes GitLab available"""
+        assert GitLabToolManager.is_available(task_data) is expected
+
+    @pytest.mark.parametrize("task_data", [
+        {"git_domain": 123, "user": {}},
+        {"git_domain": "gitlab.com", "user": None},
+        {"git_domain": "gitlab.com", "user": "alice"},
+        {"git_domain": "gitlab.com", "user": {"git_info": None}},
+        {"git_domain": "gitlab.com", "user": {"git_info": ["gitlab.com", None]}},
+    ])
+    def test_malformed_task_data(self, task_data):
+        """Test malformed task data reports unavailable instead of raising"""
+        assert GitLabToolManager.is_available(task_data) is False
+
+    def test_token_file(self, tmp_path):
+        """Test a ~/.ssh/{domain} token file makes GitLab available"""
+        clear_client_cache()
+        (tmp_path / ".ssh").mkdir()
+        (tmp_path / ".ssh" / "gitlab.com").write_text("token")
+
+        assert GitLabToolManager.is_available({"git_domain": "gitlab.com", "user": {}}) is True
+
+
+@pytest.mark.unit
+class TestFileCache:
+    """Test cases for the per-manager file content LRU cache"""
+
+    @pytest.fixture
+    def manager(self):
+        """Manager without a client; the cache works independently of GitLab"""
+        return GitLabToolManager({"git_repo_id": 1, "branch_name": "main"})
+
+    def test_evicts_least_recently_used_by_entry_count(self, manager, monkeypatch):
+        """Test the oldest unused entry is dropped once the entry limit is exceeded"""
+        monkeypatch.setattr(gitlab_tool_manager, "FILE_CACHE_MAX_ENTRIES", 2)
+        manager._cache_file("main", "a.py", "a")
+        manager._cache_file("main", "b.py", "b")
+        # Touch a.py so b.py becomes the least recently used entry
+        assert manager._get_cached_file("main", "a.py") == "a"
+        manager._cache_file("main", "c.py", "c")
+
+        assert manager._get_cached_file("main", "b.py") is None
+        assert manager._get_cached_file("main", "a.py") == "a"
+        assert manager._get_cached_file("main", "c.py") == "c"
+
+    def test_evicts_by_character_budget(self, manager, monkeypatch):
+        """Test entries are evicted until the total cached characters fit the budget"""
+        monkeypatch.setattr(gitlab_tool_manager, "FILE_CACHE_MAX_CHARS", 10)
+        manager._cache_file("main", "a.py", "a" * 4)
+        manager._cache_file("main", "b.py", "b" * 4)
+        manager._cache_file("main", "c.py", "c" * 4)
+
+        assert manager._get_cached_file("main", "a.py") is None
+        assert manager._file_cache_chars == 8
+
+        # Files larger than the whole budget are never cached
+        manager._cache_file("main", "big.py", "x" * 11)
+        assert manager._get_cached_file("main", "big.py") is None
+        assert manager._file_cache_chars == 8
+
+    def test_overwrite_keeps_character_count(self, manager):
+        """Test replacing an entry accounts for the previous content"""
+        manager._cache_file("main", "a.py", "a" * 5)
+        manager._cache_file("main", "a.py", "a" * 3)
+
+        assert manager._get_cached_file("main", "a.py") == "aaa"
+        assert manager._file_cache_chars == 3
+
+    def test_invalidate_branch_cache(self, manager):
+        """Test invalidation drops only the given branch's entries"""
+        manager._cache_file("main", "a.py", "main-a")
+        manager._cache_file("feature", "a.py", "feature-a")
+        manager._invalidate_branch_cache("feature")
+
+        assert manager._get_cached_file("feature", "a.py") is None
+        assert manager._get_cached_file("main", "a.py") == "main-a"
+        assert manager._file_cache_chars == len("main-a")
+
+    def test_read_file_uses_cache_and_branch_creation_invalidates(self, manager):
+        """Test reads hit GitLab once per file and a recreated branch is re-read"""
+        manager.gitlab_client = MagicMock()
+        project = manager.gitlab_client.projects.get.return_value
+        project.files.raw.return_value = b"print('hi')"
+
+        assert manager.read_gitlab_file("a.py", "feature") == "print('hi')"
+        assert manager.read_gitlab_file("a.py", "feature") == "print('hi')"
+        assert project.files.raw.call_count == 1
+
+        manager.create_gitlab_branch("feature", "main")
+        manager.read_gitlab_file("a.py", "feature")
+        assert project.files.raw.call_count == 2
@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from executor.agents.agno.mcp_manager import MCPManager
+
+
+MCP_SERVERS = {"docs": {"type": "streamable-http", "url": "http://localhost:9000/mcp"}}
+
+
+@pytest.mark.unit
+class TestMCPManagerToolsCache:
+    """Test cases for MCPManager.get_tools_cached"""
+
+    @pytest.fixture
+    def manager(self):
+        """MCPManager instance"""
+        return MCPManager()
+
+    def test_config_key_is_order_independent(self):
+        """Test equal configurations produce the same cache key"""
+        first = {"a": {"url": "x", "type": "sse"}, "b": {"url": "y"}}
+        second = {"b": {"url": "y"}, "a": {"type": "sse", "url": "x"}}
+        assert MCPManager.get_config_key(first) == MCPManager.get_config_key(second)
+
+    async def test_concurrent_callers_share_one_setup(self, manager):
+        """Test concurrent first callers await a single connection attempt"""
+        release = asyncio.Event()
+        tools = ["tool"]
+
+        async def connect(mcp_servers):
+            await release.wait()
+            return tools
+
+        with patch.object(manager, "_connect_mcp_tools", AsyncMock(side_effect=connect)) as mock_connect:
+            key = MCPManager.get_config_key(MCP_SERVERS)
+            waiters = [asyncio.ensure_future(manager.get_tools_cached(key, MCP_SERVERS)) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*waiters)
+            again = await manager.get_tools_cached(key, MCP_SERVERS)
+
+        assert mock_connect.await_count == 1
+        assert results == [tools, tools, tools]
+        assert again == tools
+        # Every caller gets its own list so appending tools never leaks into the cache
+        assert results[0] is not results[1]
+
+    async def test_failed_setup_is_retried(self, manager):
+        """Test a setup returning None is evicted so the next caller retries it"""
+        tools = ["tool"]
+        with patch.object(manager, "_connect_mcp_tools", AsyncMock(side_effect=[None, tools])) as mock_connect:
+            key = MCPManager.get_config_key(MCP_SERVERS)
+            assert await manager.get_tools_cached(key, MCP_SERVERS) is None
+            assert await manager.get_tools_cached(key, MCP_SERVERS) == tools
+
+        assert mock_connect.await_count == 2
+        assert key in manager._tools_futures
+
+    async def test_raised_setup_is_retried(self, manager):
+        """Test a setup that raised is evicted and does not poison later callers"""
+        tools = ["tool"]
+        with patch.object(
+            manager, "_connect_mcp_tools", AsyncMock(side_effect=[RuntimeError("connect failed"), tools])
+        ) as mock_connect:
+            key = MCPManager.get_config_key(MCP_SERVERS)
+            with pytest.raises(RuntimeError):
+                await manager.get_tools_cached(key, MCP_SERVERS)
+            assert key not in manager._tools_futures
+            assert await manager.get_tools_cached(key, MCP_SERVERS) == tools
+
+        assert mock_connect.await_count == 2
+
+    async def test_cancelled_caller_does_not_cancel_shared_setup(self, manager):
+        """Test cancelling one waiter leaves the shared setup running for the others"""
+        release = asyncio.Event()
+        tools = ["tool"]
+
+        async def connect(mcp_servers):
+            await release.wait()
+            return tools
+
+        with patch.object(manager, "_connect_mcp_tools", AsyncMock(side_effect=connect)):
+            key = MCPManager.get_config_key(MCP_SERVERS)
+            cancelled = asyncio.ensure_future(manager.get_tools_cached(key, MCP_SERVERS))
+            waiter = asyncio.ensure_future(manager.get_tools_cached(key, MCP_SERVERS))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            release.set()
+
+            assert await waiter == tools
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
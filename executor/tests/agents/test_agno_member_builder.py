@@ -0,0 +1,166 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import pytest
+from unittest.mock import MagicMock, patch
+from executor.agents.agno import member_builder
+from executor.agents.agno.member_builder import MemberBuilder
+
+
+@pytest.fixture
+def builder():
+    """MemberBuilder with mocked database and configuration"""
+    return MemberBuilder(db=MagicMock(), config_manager=MagicMock())
+
+
+@pytest.fixture
+def mock_gitlab_manager():
+    """Mock GitLabToolManager so no GitLab client is created"""
+    with patch.object(member_builder, "GitLabToolManager") as mock_cls:
+        mock_cls.return_value.create_tools.return_value = ("read_file", "list_files")
+        yield mock_cls
+
+
+@pytest.mark.unit
+class TestGitLabToolsReuse:
+    """Test cases for sharing GitLab tools between members of one task"""
+
+    def test_tools_are_created_once_per_task(self, builder, mock_gitlab_manager):
+        """Test every member of the same task_data reuses one GitLabToolManager"""
+        task_data = {"git_domain": "gitlab.com"}
+
+        first = builder._get_gitlab_tools(task_data)
+        second = builder._get_gitlab_tools(task_data)
+
+        assert first is second
+        mock_gitlab_manager.assert_called_once_with(task_data)
+
+    def test_new_task_gets_new_tools(self, builder, mock_gitlab_manager):
+        """Test a different task_data object builds its own manager"""
+        builder._get_gitlab_tools({"git_domain": "gitlab.com"})
+        builder._get_gitlab_tools({"git_domain": "gitlab.com"})
+
+        assert mock_gitlab_manager.call_count == 2
+
+    async def test_members_get_their_own_tool_lists(self, builder, mock_gitlab_manager):
+        """Test shared GitLab tools are copied into each member's tool list"""
+        task_data = {"git_domain": "gitlab.com"}
+        with patch.object(builder.mcp_manager, "setup_mcp_tools", return_value=None):
+            first, _ = await builder._assemble_tools({}, task_data, "member A", "gitlab_sdk")
+            second, _ = await builder._assemble_tools({}, task_data, "member B", "gitlab_sdk")
+
+        assert first == second == ["read_file", "list_files"]
+        assert first is not second
+        mock_gitlab_manager.assert_called_once()
+
+    async def test_unmatched_domain_without_token_skips_gitlab(self, builder, mock_gitlab_manager):
+        """Test no GitLab manager is built when GitLab is not configured for the task"""
+        mock_gitlab_manager.is_available.return_value = False
+        with patch.object(builder.mcp_manager, "setup_mcp_tools", return_value=["mcp"]):
+            tools, _ = await builder._assemble_tools({}, {"git_domain": "git.corp.com"}, "member A", None)
+
+        assert tools == ["mcp"]
+        mock_gitlab_manager.assert_not_called()
+
+
+@pytest.mark.unit
+class TestCreateMembers:
+    """Test cases for concurrent member creation"""
+
+    MEMBER_CONFIGS = [{"name": "Alice"}, {"name": "Bob"}, {"name": "Carol"}]
+
+    @pytest.fixture
+    def finished(self):
+        """Names of members in completion order"""
+        return []
+
+    @pytest.fixture
+    def fake_create_member(self, finished):
+        """Replace create_member with a coroutine that finishes in reverse start order"""
+        delays = {"Alice": 0.03, "Bob": 0.02, "Carol": 0.01}
+
+        async def create_member(self, member_config, task_data, tool_type=None):
+            name = member_config["name"]
+            await asyncio.sleep(delays.get(name, 0))
+            finished.append(name)
+            if name == "Bob":
+                return None
+            if name == "Carol" and member_config.get("raise"):
+                raise RuntimeError("model setup failed")
+            return f"agent-{name}"
+
+        with patch.object(MemberBuilder, "create_member", create_member):
+            yield
+
+    async def test_results_stay_aligned_with_configs(self, builder, fake_create_member, finished):
+        """Test results follow config order, with None for failed members"""
+        with patch.object(member_builder.RepositoryDetector, "detect_tool_type", return_value=None):
+            members = await builder.create_members(self.MEMBER_CONFIGS, {})
+
+        assert members == ["agent-Alice", None, "agent-Carol"]
+        # Members ran concurrently, so the shortest setup finished first
+        assert finished == ["Carol", "Bob", "Alice"]
+
+    async def test_raised_member_becomes_none(self, builder, fake_create_member):
+        """Test an exception escaping create_member does not fail the other members"""
+        configs = [{"name": "Alice"}, {"name": "Carol", "raise": True}]
+        with patch.object(member_builder.RepositoryDetector, "detect_tool_type", return_value=None):
+            members = await builder.create_members(configs, {})
+
+        assert members == ["agent-Alice", None]
+
+    async def test_tool_type_is_detected_once(self, builder):
+        """Test the repository tool type is detected once and passed to every member"""
+        tool_types = []
+
+        async def create_member(self, member_config, task_data, tool_type=None):
+            tool_types.append(tool_type)
+            return member_config["name"]
+
+        with patch.object(MemberBuilder, "create_member", create_member), \
+             patch.object(member_builder.RepositoryDetector, "detect_tool_type", return_value="gitlab_sdk") as detect:
+            await builder.create_members(self.MEMBER_CONFIGS, {"git_domain": "gitlab.com"})
+
+        detect.assert_called_once()
+        assert tool_types == ["gitlab_sdk"] * 3
+
+    async def test_create_members_from_config_drops_failures(self, builder, fake_create_member):
+        """Test the filtered helper only returns created members"""
+        with patch.object(member_builder.RepositoryDetector, "detect_tool_type", return_value=None):
+            members = await builder.create_members_from_config(self.MEMBER_CONFIGS, {})
+
+        assert members == ["agent-Alice", "agent-Carol"]
+
+    async def test_empty_config(self, builder):
+        """Test no members are created without configuration"""
+        assert await builder.create_members([], {}) == []
+        assert await builder.create_members_from_config([], {}) == []
+
+
+@pytest.mark.unit
+class TestMCPSetupConcurrency:
+    """Test cases for the cap on concurrent MCP setup"""
+
+    async def test_mcp_setup_is_capped(self):
+        """Test no more than max_concurrent_members MCP setups run at once"""
+        builder = MemberBuilder(db=MagicMock(), config_manager=MagicMock(), max_concurrent_members=2)
+        running = 0
+        peak = 0
+
+        async def setup_mcp_tools(config):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return None
+
+        with patch.object(builder.mcp_manager, "setup_mcp_tools", setup_mcp_tools), \
+             patch.object(member_builder.GitLabToolManager, "is_available", return_value=False):
+            await asyncio.gather(*(
+                builder._assemble_tools({}, {}, f"member {i}", None) for i in range(5)
+            ))
+
+        assert peak == 2
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2025 Weibo, Inc.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from unittest.mock import MagicMock, patch
+from executor.agents.agno import model_factory
+from executor.agents.agno.model_factory import ModelFactory
+
+
+AGENT_CONFIG = {"env": {"model": "openai", "model_id": "gpt-4", "api_key": "sk-test"}}
+DEFAULT_HEADERS = {"X-User": "alice"}
+
+
+@pytest.mark.unit
+class TestModelFactoryCache:
+    """Test cases for the opt-in ModelFactory model cache"""
+
+    @pytest.fixture(autouse=True)
+    def mock_build_model(self):
+        """Mock model construction so every build returns a distinct model"""
+        ModelFactory._MODEL_CACHE.clear()
+        with patch.object(ModelFactory, "_build_model", side_effect=lambda *args: MagicMock()) as mock_build:
+            yield mock_build
+        ModelFactory._MODEL_CACHE.clear()
+
+    def test_cache_disabled_by_default(self, mock_build_model):
+        """Test every call builds a new model unless the cache is enabled"""
+        with patch.object(model_factory.config, "MODEL_CACHE_ENABLED", False):
+            first = ModelFactory.create_model(AGENT_CONFIG, DEFAULT_HEADERS)
+            second = ModelFactory.create_model(AGENT_CONFIG, DEFAULT_HEADERS)
+
+        assert first is not second
+        assert mock_build_model.call_count == 2
+        assert not ModelFactory._MODEL_CACHE
+
+    def test_cache_shares_identical_configs(self, mock_build_model):
+        """Test equal agent configs and headers share one model when enabled"""
+        with patch.object(model_factory.config, "MODEL_CACHE_ENABLED", True):
+            first = ModelFactory.create_model(AGENT_CONFIG, DEFAULT_HEADERS)
+            second = ModelFactory.create_model(
+                {"env": {"api_key": "sk-test", "model_id": "gpt-4", "model": "openai"}},
+                dict(DEFAULT_HEADERS),
+            )
+
+        assert first is second
+        assert mock_build_model.call_count == 1
+
+    def test_cache_separates_different_configs(self, mock_build_model):
+        """Test a different config or different headers build a separate model"""
+        with patch.object(model_factory.config, "MODEL_CACHE_ENABLED", True):
+            base = ModelFactory.create_model(AGENT_CONFIG, DEFAULT_HEADERS)
+            other_headers = ModelFactory.create_model(AGENT_CONFIG, {"X-User": "bob"})
+            other_config = ModelFactory.create_model({"env": {"model": "claude"}}, DEFAULT_HEADERS)
+
+        assert len({id(base), id(other_headers), id(other_config)}) == 3
+        assert mock_build_model.call_count == 3
+
+    def test_cache_evicts_oldest_entry(self, mock_build_model, monkeypatch):
+        """Test the cache stays bounded by evicting its oldest entry"""
+        monkeypatch.setattr(model_factory, "MODEL_CACHE_MAX_ENTRIES", 2)
+        with patch.object(model_factory.config, "MODEL_CACHE_ENABLED", True):
+            first = ModelFactory.create_model({"env": {"model_id": "a"}}, {})
+            ModelFactory.create_model({"env": {"model_id": "b"}}, {})
+            ModelFactory.create_model({"env": {"model_id": "c"}}, {})
+
+            assert len(ModelFactory._MODEL_CACHE) == 2
+            assert ModelFactory.create_model({"env": {"model_id": "a"}}, {}) is not first
+        assert mock_build_model.call_count == 4
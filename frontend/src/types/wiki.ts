@@ -83,7 +83,9 @@ export interface WikiGeneration {
 }
 
 export interface WikiGenerationsResponse {
-  total: number;
+  // Only computed on the first page unless include_total is requested
+  total: number | null;
+  has_next: boolean;
   items: WikiGeneration[];
 }
 
@@ -63,8 +63,10 @@ def setup_logger(name, level=logging.INFO,
 
     # Prevent adding duplicate handlers
     if logger.handlers:
-        # Logger already configured, just update level and return
-        logger.setLevel(level)
+        # Logger already configured, just update level and return.
+        # setLevel clears every logger's isEnabledFor cache, so skip it when unchanged
+        if logger.level != level:
+            logger.setLevel(level)
         return logger
 
     # Set logger level